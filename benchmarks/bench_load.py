@@ -0,0 +1,100 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+"""
+Benchmark of the cold start latency of the library: import, `loader.load()` and the
+first normalizer and tokenizer calls, with the eager (default) and the lazy loading
+of the resources. Each measurement runs in a fresh Python process, from the root of
+the repository:
+
+    python benchmarks/bench_load.py --runs 5
+    python benchmarks/bench_load.py --runs 5 --cold-cache
+
+With --cold-cache, each process starts with an empty compiled resource cache (see
+`indicnlp.resource_cache`), as on the first use of the library.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Runs in the child process, prints its measurements as JSON
+_CHILD = """
+import json, resource, sys, time
+
+t0 = time.perf_counter()
+from indicnlp import loader
+from indicnlp.normalize.indic_normalize import IndicNormalizerFactory
+from indicnlp.tokenize import indic_tokenize
+
+loader.load(lazy={lazy})
+t1 = time.perf_counter()
+
+IndicNormalizerFactory().get_normalizer("hi").normalize("नमस्ते दुनिया")
+indic_tokenize.trivial_tokenize("नमस्ते, दुनिया!")
+t2 = time.perf_counter()
+
+print(json.dumps({{
+    "load_ms": 1000 * (t1 - t0),
+    "total_ms": 1000 * (t2 - t0),
+    "maxrss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "pandas": "pandas" in sys.modules,
+}}))
+"""
+
+
+def run_once(lazy, cold_cache=False):
+    """
+    Returns the measurements of one cold start, in a new process
+    """
+    env = dict(os.environ)
+    with tempfile.TemporaryDirectory() as cache_path:
+        if cold_cache:
+            env["INDIC_CACHE_PATH"] = cache_path
+        out = subprocess.run(
+            [sys.executable, "-c", _CHILD.format(lazy=lazy)],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        ).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Cold start latency of the library, with eager and lazy loading"
+    )
+    parser.add_argument("--runs", type=int, default=5, help="runs per mode")
+    parser.add_argument(
+        "--cold-cache",
+        action="store_true",
+        help="start each run with an empty compiled resource cache",
+    )
+    args = parser.parse_args(argv)
+
+    for name, lazy in [("eager", False), ("lazy", True)]:
+        results = [run_once(lazy, args.cold_cache) for _ in range(args.runs)]
+        print(
+            "{:5s}: import+load {:6.1f} ms, +first calls {:6.1f} ms, "
+            "maxrss {:5.1f} MB, pandas imported: {}".format(
+                name,
+                statistics.median(r["load_ms"] for r in results),
+                statistics.median(r["total_ms"] for r in results),
+                statistics.median(r["maxrss_mb"] for r in results),
+                any(r["pandas"] for r in results),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
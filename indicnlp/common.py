@@ -6,7 +6,10 @@
 #  LICENSE file in the root directory of this source tree.
 #
 
+import functools
+import inspect
 import os
+import threading
 from pathlib import Path
 
 """
@@ -61,6 +64,62 @@ def set_resources_path(resources_path):
     INDIC_RESOURCES_PATH = resources_path
 
 
+# Guards the first load of lazily initialized module resources
+_RESOURCE_LOCK = threading.RLock()
+
+
+def load_lazy_resource(module_globals, name, loader):
+    """
+    Returns the module level resource `name` from `module_globals`. If the resource
+    has not been loaded yet, `loader` is called (once, even if several threads ask
+    for it concurrently) and is expected to define `name` in the module globals.
+    """
+    try:
+        return module_globals[name]
+    except KeyError:
+        pass
+
+    with _RESOURCE_LOCK:
+        if name not in module_globals:
+            loader()
+        return module_globals[name]
+
+
+# Instances returned by get_shared_instance, keyed by class and arguments
+_SHARED_INSTANCES = {}
+
+_signature = functools.lru_cache(maxsize=None)(inspect.signature)
+
+
+def get_shared_instance(cls, *args, **kwargs):
+    """
+    Returns the instance of cls constructed with the given arguments, shared by all
+    the callers asking for the same class and arguments (once the default values are
+    filled in). It is constructed once per process, so it must not be modified.
+    """
+    bound = _signature(cls).bind(*args, **kwargs)
+    bound.apply_defaults()
+    key = (cls, tuple(bound.arguments.items()))
+
+    try:
+        return _SHARED_INSTANCES[key]
+    except KeyError:
+        pass
+
+    with _RESOURCE_LOCK:
+        if key not in _SHARED_INSTANCES:
+            _SHARED_INSTANCES[key] = cls(*bound.args, **bound.kwargs)
+        return _SHARED_INSTANCES[key]
+
+
+def clear_shared_instances():
+    """
+    Forgets the instances returned by get_shared_instance
+    """
+    with _RESOURCE_LOCK:
+        _SHARED_INSTANCES.clear()
+
+
 class IndicNlpException(Exception):
     """
     Exceptions thrown by Indic NLP Library components are instances of this class.
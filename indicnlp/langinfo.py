@@ -102,6 +102,35 @@ _APPROXIMANT_SET = {0x2F, 0x30, 0x31, 0x32, 0x33, 0x34, 0x35}
 # TODO: ha has to be properly categorized
 
 
+class ScriptDescriptor(object):
+    """
+    Precomputed information about the script of a language in SCRIPT_RANGES:
+    * base: codepoint of the first character (offset 0) of the script
+    * valid_offsets: 128 entry bitmap over the script offsets, valid_offsets[o] is 1 if
+      offset o lies in the range coordinated across the Brahmi derived scripts
+    """
+
+    __slots__ = ("lang", "base", "valid_offsets")
+
+    def __init__(self, lang, base):
+        self.lang = lang
+        self.base = base
+        self.valid_offsets = bytes(
+            1
+            if COORDINATED_RANGE_START_INCLUSIVE <= o <= COORDINATED_RANGE_END_INCLUSIVE
+            else 0
+            for o in range(0x80)
+        )
+
+
+## Derived from SCRIPT_RANGES: set of supported languages and the script descriptor of each
+SUPPORTED_LANGUAGES = frozenset(SCRIPT_RANGES)
+SCRIPT_DESCRIPTORS = {
+    lang: ScriptDescriptor(lang, script_range[0])
+    for lang, script_range in SCRIPT_RANGES.items()
+}
+
+
 def is_danda_delim(lang):
     """
     Returns True if danda/double danda is a possible delimiter for the language
@@ -113,14 +142,14 @@ def get_offset(c, lang):
     """
     Applicable to Brahmi derived Indic scripts
     """
-    return ord(c) - SCRIPT_RANGES[lang][0]
+    return ord(c) - SCRIPT_DESCRIPTORS[lang].base
 
 
 def offset_to_char(c, lang):
     """
     Applicable to Brahmi derived Indic scripts
     """
-    return chr(c + SCRIPT_RANGES[lang][0])
+    return chr(c + SCRIPT_DESCRIPTORS[lang].base)
 
 
 def in_coordinated_range(c_offset):
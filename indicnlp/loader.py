@@ -12,11 +12,18 @@ from indicnlp.script import english_script
 from indicnlp.transliterate import unicode_transliterate
 
 
-def load():
+def load(lazy=False, shared_phonetic_tables=None):
     """
     Initializes the Indic NLP library. Clients should call this method before using the library.
 
     Any module requiring initialization should have a init() method, to which a call must be made from this method
+
+    lazy: if True, the resource tables (phonetic data, ITRANS maps) are not read here but
+        the first time they are accessed. This saves start-up time and memory for processes
+        which only use the tokenizers, normalizers or script-range transliteration.
+    shared_phonetic_tables: name of a shared memory block created by
+        `shared_phonetic_tables.publish_phonetic_tables()` in another process. If given, the
+        phonetic tables are attached read-only from that block instead of being loaded.
     """
 
     ### Order of intialization may matter
@@ -24,6 +31,14 @@ def load():
     # Common has to be loaded first to get access to resources
     common.init()
 
+    if shared_phonetic_tables is not None:
+        from indicnlp.script import shared_phonetic_tables as spt
+
+        spt.attach_phonetic_tables(shared_phonetic_tables)
+
+    if lazy:
+        return
+
     ## Initialization of Indic scripts module
     indic_scripts.init()
 
@@ -15,8 +15,13 @@
 
 import sys
 import codecs
+import functools
+import re as stdlib_re
 import regex as re
+from indicnlp import common
 from indicnlp import langinfo
+from indicnlp import parallel
+from indicnlp.normalize.rule_compiler import ASCII_CHARS, CALL, REPLACE, SUB, RulePlan
 
 
 class NormalizerI(object):
@@ -29,8 +34,8 @@ class NormalizerI(object):
     * Byte order mark, word joiner, etc. removal
     * ZERO_WIDTH_NON_JOINER and ZERO_WIDTH_JOINER removal
     * ZERO_WIDTH_SPACE and NO_BREAK_SPACE replaced by spaces
-    Script specific normalizers should derive from this class and override the normalize() method.
-    They can call the super class 'normalize() method to avail of the common normalization
+    Script specific normalizers should derive from this class and override the get_rules() method.
+    They can call the super class get_rules() method to avail of the common normalization
     """
 
     BYTE_ORDER_MARK = "\ufeff"
@@ -44,31 +49,99 @@ class NormalizerI(object):
     ZERO_WIDTH_NON_JOINER = "\u200c"
     ZERO_WIDTH_JOINER = "\u200d"
 
-    def _normalize_punctuations(self, text):
+    # separator of the texts normalized together by normalize_stream
+    TEXT_SEPARATOR = "\n"
+
+    def _get_punctuation_rules(self):
         """
-        Normalize punctuations.
+        Rules normalizing punctuations.
         Applied many of the punctuation normalizations that are part of MosesNormalizer
         from sacremoses
         """
-        text = text.replace(NormalizerI.BYTE_ORDER_MARK, "")
-        text = text.replace("„", r'"')
-        text = text.replace("“", r'"')
-        text = text.replace("”", r'"')
-        text = text.replace("–", r"-")
-        text = text.replace("—", r" - ")
-        text = text.replace("´", r"'")
-        text = text.replace("‘", r"'")
-        text = text.replace("‚", r"'")
-        text = text.replace("’", r"'")
-        text = text.replace("''", r'"')
-        text = text.replace("´´", r'"')
-        text = text.replace("…", r"...")
-
-        return text
+        return [
+            (REPLACE, NormalizerI.BYTE_ORDER_MARK, ""),
+            (REPLACE, "„", r'"'),
+            (REPLACE, "“", r'"'),
+            (REPLACE, "”", r'"'),
+            (REPLACE, "–", r"-"),
+            (REPLACE, "—", r" - "),
+            (REPLACE, "´", r"'"),
+            (REPLACE, "‘", r"'"),
+            (REPLACE, "‚", r"'"),
+            (REPLACE, "’", r"'"),
+            (REPLACE, "''", r'"'),
+            (REPLACE, "´´", r'"'),
+            (REPLACE, "…", r"..."),
+        ]
 
     def normalize(self, text):
         pass
 
+    def _can_join_texts(self):
+        """
+        Is normalizing texts joined by TEXT_SEPARATOR the same as normalizing them
+        one by one?
+        """
+        return False
+
+    def _normalize_texts(self, texts):
+        """
+        Normalizes a list of texts, in a single call to normalize if possible
+        """
+        sep = NormalizerI.TEXT_SEPARATOR
+        if len(texts) > 1 and self._can_join_texts():
+            text = sep.join(texts)
+            # the texts must not contain the separator themselves
+            if text.count(sep) == len(texts) - 1:
+                out = self.normalize(text).split(sep)
+                if len(out) == len(texts):
+                    return out
+        return [self.normalize(text) for text in texts]
+
+    def normalize_stream(self, texts, n_jobs=1, chunk_size=parallel.DEFAULT_CHUNK_SIZE):
+        """
+        Lazily normalizes an iterable of texts, yielding the results in order. The
+        texts of a chunk are normalized together when the normalization of a text
+        does not depend on its neighbours.
+
+        texts: iterable of texts to normalize
+        n_jobs: number of worker processes, see `indicnlp.parallel.get_num_jobs`
+        chunk_size: number of texts normalized (and sent to a worker) at a time
+        """
+        return parallel.imap_chunked(
+            _normalize_chunk,
+            texts,
+            args=(self,),
+            n_jobs=n_jobs,
+            chunk_size=chunk_size,
+        )
+
+    def normalize_batch(self, texts, n_jobs=1, chunk_size=parallel.DEFAULT_CHUNK_SIZE):
+        """
+        Normalizes a list of texts, returns the list of results. See
+        `normalize_stream` for the arguments.
+        """
+        return list(self.normalize_stream(texts, n_jobs=n_jobs, chunk_size=chunk_size))
+
+    def get_rules(self):
+        """
+        Returns the rewrite rules applied by normalize, in order. See
+        `indicnlp.normalize.rule_compiler`
+        """
+        return [(CALL, self.normalize)]
+
+
+def _lookup_replacement(table, match):
+    # replacement function of the nasal patterns, the matched text is kept if it is
+    # not in the table
+    text = match.group()
+    return table.get(text, text)
+
+
+def _normalize_chunk(texts, normalizer):
+    # runs in the worker processes, which receive a copy of the normalizer
+    return normalizer._normalize_texts(texts)
+
 
 class BaseNormalizer(NormalizerI):
     def __init__(
@@ -88,15 +161,57 @@ class BaseNormalizer(NormalizerI):
         self._init_normalize_chandras()
         self._init_normalize_nasals()
         self._init_normalize_vowel_ending()
+        # compiled on first use, once the script specific attributes are set
+        self._plan = None
         # self._init_visarga_correction()
 
+    def _get_character_rules(self):
+        """
+        Rules deleting or replacing control characters, punctuations and chandras
+        """
+        rules = [
+            (REPLACE, NormalizerI.BYTE_ORDER_MARK, ""),
+            (REPLACE, NormalizerI.BYTE_ORDER_MARK_2, ""),
+            (REPLACE, NormalizerI.WORD_JOINER, ""),
+            (REPLACE, NormalizerI.SOFT_HYPHEN, ""),
+            (REPLACE, NormalizerI.ZERO_WIDTH_SPACE, " "),
+            (REPLACE, NormalizerI.NO_BREAK_SPACE, " "),
+            (REPLACE, NormalizerI.ZERO_WIDTH_NON_JOINER, ""),
+            (REPLACE, NormalizerI.ZERO_WIDTH_JOINER, ""),
+        ]
+        rules.extend(self._get_punctuation_rules())
+        if self.do_normalize_chandras:
+            rules.extend((REPLACE, m, r) for m, r in self.chandra_substitutions)
+        return rules
+
     def _init_normalize_vowel_ending(self):
+        # words ending with a consonant get a halant (IE) or an 'a' ki maatra
+        # (Dravidian), words ending with a halant or a maatra are left as is
         if self.lang in langinfo.IE_LANGUAGES:
-            self.fn_vowel_ending = self._normalize_word_vowel_ending_ie
+            vowel_ending = langinfo.offset_to_char(langinfo.HALANTA_OFFSET, self.lang)
         elif self.lang in langinfo.DRAVIDIAN_LANGUAGES:
-            self.fn_vowel_ending = self._normalize_word_vowel_ending_dravidian
+            vowel_ending = langinfo.offset_to_char(0x3E, self.lang)
+        else:
+            vowel_ending = None
+
+        # the words of the text are separated by spaces: the vowel ending is inserted
+        # after a consonant followed by a space or the end of the text. The standard
+        # library re module is faster than regex for this pattern, and the
+        # replacement has no group reference to expand
+        if vowel_ending is None:
+            self.vowel_ending_pat_repl = None
         else:
-            self.fn_vowel_ending = lambda x: x
+            consonants = [
+                langinfo.offset_to_char(offset, self.lang)
+                for offset in range(0x15, 0x3A)
+            ]
+            pat = stdlib_re.compile(
+                r"(?<=[{start_r}-{end_r}])(?= |\Z)".format(
+                    start_r=consonants[0], end_r=consonants[-1]
+                )
+            )
+            self.vowel_ending_pat_repl = (pat, vowel_ending)
+            self.vowel_ending_alphabet = frozenset(consonants) | {" "}
 
     def _init_normalize_chandras(self):
         substitution_offsets = [
@@ -117,11 +232,6 @@ class BaseNormalizer(NormalizerI):
             for x in substitution_offsets
         ]
 
-    def _normalize_chandras(self, text):
-        for match, repl in self.chandra_substitutions:
-            text = text.replace(match, repl)
-        return text
-
     def _init_to_anusvaara_strict(self):
         """
         `r1_nasal=re.compile(r'\\u0919\\u094D([\\u0915-\\u0918])')`
@@ -139,31 +249,28 @@ class BaseNormalizer(NormalizerI):
         halant_offset = 0x4D
         anusvaara_offset = 0x02
 
-        pats = []
+        halant = langinfo.offset_to_char(halant_offset, self.lang)
+        anusvaara = langinfo.offset_to_char(anusvaara_offset, self.lang)
 
+        # nasal+halant+consonant of the same varga -> anusvaara+consonant
+        table = {}
         for pat_signature in pat_signatures:
-            pat = re.compile(
-                r"{nasal}{halant}([{start_r}-{end_r}])".format(
-                    nasal=langinfo.offset_to_char(pat_signature[0], self.lang),
-                    halant=langinfo.offset_to_char(halant_offset, self.lang),
-                    start_r=langinfo.offset_to_char(pat_signature[1], self.lang),
-                    end_r=langinfo.offset_to_char(pat_signature[2], self.lang),
-                )
-            )
-            pats.append(pat)
+            nasal = langinfo.offset_to_char(pat_signature[0], self.lang)
+            for offset in range(pat_signature[1], pat_signature[2] + 1):
+                consonant = langinfo.offset_to_char(offset, self.lang)
+                table[nasal + halant + consonant] = anusvaara + consonant
 
-        repl_string = "{anusvaara}\\1".format(
-            anusvaara=langinfo.offset_to_char(anusvaara_offset, self.lang)
+        # a single pass for all the vargas: the pattern matches any nasal followed by
+        # a halant and a consonant, which is left as is if the vargas differ
+        pat = re.compile(
+            r"[{nasals}]{halant}[{consonants}]".format(
+                nasals="".join(sorted({k[0] for k in table})),
+                halant=halant,
+                consonants="".join(sorted({k[2] for k in table})),
+            )
         )
 
-        self.pats_repls = (pats, repl_string)
-
-    def _to_anusvaara_strict(self, text):
-        pats, repl_string = self.pats_repls
-        for pat in pats:
-            text = pat.sub(repl_string, text)
-
-        return text
+        self.pats_repls = (pat, functools.partial(_lookup_replacement, table))
 
     def _init_to_anusvaara_relaxed(self):
         """
@@ -191,10 +298,6 @@ class BaseNormalizer(NormalizerI):
 
         self.pats_repls = (pat, repl_string)
 
-    def _to_anusvaara_relaxed(self, text):
-        pat, repl_string = self.pats_repls
-        return pat.sub(repl_string, text)
-
     def _init_to_nasal_consonants(self):
         """
         `r1_nasal=re.compile(r'\\u0919\\u094D([\\u0915-\\u0918])')`
@@ -212,31 +315,27 @@ class BaseNormalizer(NormalizerI):
         halant_offset = 0x4D
         anusvaara_offset = 0x02
 
-        pats = []
-        repl_strings = []
+        halant = langinfo.offset_to_char(halant_offset, self.lang)
+        anusvaara = langinfo.offset_to_char(anusvaara_offset, self.lang)
 
+        # anusvaara+consonant -> nasal+halant+consonant of the varga of the consonant.
+        # The dental vargas of na and nnna share their consonants, the first one wins
+        table = {}
         for pat_signature in pat_signatures:
-            pat = re.compile(
-                r"{anusvaara}([{start_r}-{end_r}])".format(
-                    anusvaara=langinfo.offset_to_char(anusvaara_offset, self.lang),
-                    start_r=langinfo.offset_to_char(pat_signature[1], self.lang),
-                    end_r=langinfo.offset_to_char(pat_signature[2], self.lang),
-                )
-            )
-            pats.append(pat)
-            repl_string = "{nasal}{halant}\\1".format(
-                nasal=langinfo.offset_to_char(pat_signature[0], self.lang),
-                halant=langinfo.offset_to_char(halant_offset, self.lang),
-            )
-            repl_strings.append(repl_string)
+            nasal = langinfo.offset_to_char(pat_signature[0], self.lang)
+            for offset in range(pat_signature[1], pat_signature[2] + 1):
+                consonant = langinfo.offset_to_char(offset, self.lang)
+                table.setdefault(anusvaara + consonant, nasal + halant + consonant)
 
-        self.pats_repls = list(zip(pats, repl_strings))
-
-    def _to_nasal_consonants(self, text):
-        for pat, repl in self.pats_repls:
-            text = pat.sub(repl, text)
+        # a single pass for all the vargas
+        pat = re.compile(
+            r"{anusvaara}[{consonants}]".format(
+                anusvaara=anusvaara,
+                consonants="".join(sorted({k[1] for k in table})),
+            )
+        )
 
-        return text
+        self.pats_repls = (pat, functools.partial(_lookup_replacement, table))
 
     def _init_normalize_nasals(self):
         if self.nasals_mode == "to_anusvaara_strict":
@@ -246,67 +345,59 @@ class BaseNormalizer(NormalizerI):
         elif self.nasals_mode == "to_nasal_consonants":
             self._init_to_nasal_consonants()
 
-    def _normalize_nasals(self, text):
-        if self.nasals_mode == "to_anusvaara_strict":
-            return self._to_anusvaara_strict(text)
-        elif self.nasals_mode == "to_anusvaara_relaxed":
-            return self._to_anusvaara_relaxed(text)
-        elif self.nasals_mode == "to_nasal_consonants":
-            return self._to_nasal_consonants(text)
+    def _get_nasal_rules(self):
+        if self.nasals_mode in (
+            "to_anusvaara_strict",
+            "to_anusvaara_relaxed",
+            "to_nasal_consonants",
+        ):
+            pat, repl = self.pats_repls
+            return [(SUB, pat, repl, None)]
         else:
-            return text
+            return []
 
-    def _normalize_word_vowel_ending_dravidian(self, word):
+    def normalize(self, text):
         """
-        for Dravidian
-        - consonant ending: add 'a' ki maatra
-        - halant ending: no change
-        - 'a' ki maatra: no change
+        Applies the rules of get_rules, compiled into a few passes over the text.
+        Script specific normalizers extend get_rules
         """
-        if len(word) > 0 and langinfo.is_consonant(word[-1], self.lang):
-            return word + langinfo.offset_to_char(0x3E, self.lang)
-        else:
-            return word
+        return self.get_plan().apply(text)
 
-    def _normalize_word_vowel_ending_ie(self, word):
-        """
-        for IE
-        - consonant ending: add halant
-        - halant ending: no change
-        - 'a' ki maatra: no change
-        """
-        if len(word) > 0 and langinfo.is_consonant(word[-1], self.lang):
-            return word + langinfo.offset_to_char(langinfo.HALANTA_OFFSET, self.lang)
-        else:
-            return word
+    def __getstate__(self):
+        # the compiled rules are rebuilt on first use, e.g. by the worker processes
+        state = self.__dict__.copy()
+        state["_plan"] = None
+        return state
 
-    def _normalize_vowel_ending(self, text):
-        return " ".join([self.fn_vowel_ending(w) for w in text.split(" ")])
+    def _can_join_texts(self):
+        # the patterns of the rules never match a newline, but the vowel ending is
+        # normalized on space separated words, and opaque rules may see across it
+        if self.do_normalize_vowel_ending:
+            return False
+        return all(rule[0] != CALL for rule in self.get_plan().rules)
 
-    def normalize(self, text):
+    def get_plan(self):
         """
-        Method to be implemented for normalization for each script
+        Returns the compiled rules of the normalizer (a `RulePlan`)
         """
-        text = text.replace(NormalizerI.BYTE_ORDER_MARK, "")
-        text = text.replace(NormalizerI.BYTE_ORDER_MARK_2, "")
-        text = text.replace(NormalizerI.WORD_JOINER, "")
-        text = text.replace(NormalizerI.SOFT_HYPHEN, "")
+        if self._plan is None:
+            self._plan = RulePlan(self.get_rules())
+        return self._plan
 
-        text = text.replace(NormalizerI.ZERO_WIDTH_SPACE, " ")  # ??
-        text = text.replace(NormalizerI.NO_BREAK_SPACE, " ")
+    def get_rules(self):
+        # control characters, punctuations and chandras
+        rules = self._get_character_rules()
+        rules.extend(self._get_nasal_rules())
+        if self.do_normalize_vowel_ending and self.vowel_ending_pat_repl is not None:
+            pat, repl = self.vowel_ending_pat_repl
+            rules.append((SUB, pat, repl, self.vowel_ending_alphabet))
 
-        text = text.replace(NormalizerI.ZERO_WIDTH_NON_JOINER, "")
-        text = text.replace(NormalizerI.ZERO_WIDTH_JOINER, "")
+        return rules
 
-        text = self._normalize_punctuations(text)
-
-        if self.do_normalize_chandras:
-            text = self._normalize_chandras(text)
-        text = self._normalize_nasals(text)
-        if self.do_normalize_vowel_ending:
-            text = self._normalize_vowel_ending(text)
-
-        return text
+    def _get_visarga_rule(self, visarga):
+        # the visarga patterns only match ASCII characters, and the replacement
+        # inserts a backslash and a '1' before the visarga
+        return (SUB, self.visarga_pattern, "\\\\1" + visarga, ASCII_CHARS)
 
     def get_char_stats(self, text):
         print(len(re.findall(NormalizerI.BYTE_ORDER_MARK, text)))
@@ -356,36 +447,41 @@ class DevanagariNormalizer(BaseNormalizer):
         )
         self.visarga_pattern = re.compile(r"([\\u0900-\\u097f]):")
 
-    def normalize(self, text):
+    def get_rules(self):
         # common normalization for Indic scripts
-        text = super(DevanagariNormalizer, self).normalize(text)
+        rules = super(DevanagariNormalizer, self).get_rules()
 
         # chandra a replacement for Marathi
-        text = text.replace("\u0972", "\u090f")
+        rules.append((REPLACE, "\u0972", "\u090f"))
 
         # decomposing Nukta based composite characters
-        text = text.replace("\u0929", "\u0928" + DevanagariNormalizer.NUKTA)
-        text = text.replace("\u0931", "\u0930" + DevanagariNormalizer.NUKTA)
-        text = text.replace("\u0934", "\u0933" + DevanagariNormalizer.NUKTA)
-        text = text.replace("\u0958", "\u0915" + DevanagariNormalizer.NUKTA)
-        text = text.replace("\u0959", "\u0916" + DevanagariNormalizer.NUKTA)
-        text = text.replace("\u095a", "\u0917" + DevanagariNormalizer.NUKTA)
-        text = text.replace("\u095b", "\u091c" + DevanagariNormalizer.NUKTA)
-        text = text.replace("\u095c", "\u0921" + DevanagariNormalizer.NUKTA)
-        text = text.replace("\u095d", "\u0922" + DevanagariNormalizer.NUKTA)
-        text = text.replace("\u095e", "\u092b" + DevanagariNormalizer.NUKTA)
-        text = text.replace("\u095f", "\u092f" + DevanagariNormalizer.NUKTA)
+        rules.extend(
+            (REPLACE, c, base + DevanagariNormalizer.NUKTA)
+            for c, base in [
+                ("\u0929", "\u0928"),
+                ("\u0931", "\u0930"),
+                ("\u0934", "\u0933"),
+                ("\u0958", "\u0915"),
+                ("\u0959", "\u0916"),
+                ("\u095a", "\u0917"),
+                ("\u095b", "\u091c"),
+                ("\u095c", "\u0921"),
+                ("\u095d", "\u0922"),
+                ("\u095e", "\u092b"),
+                ("\u095f", "\u092f"),
+            ]
+        )
 
         if self.remove_nuktas:
-            text = text.replace(DevanagariNormalizer.NUKTA, "")
+            rules.append((REPLACE, DevanagariNormalizer.NUKTA, ""))
 
         # replace pipe character for poorna virama
-        text = text.replace("\u007c", "\u0964")
+        rules.append((REPLACE, "\u007c", "\u0964"))
 
         # correct visarga
-        text = self.visarga_pattern.sub("\\\\1\\u0903", text)
+        rules.append(self._get_visarga_rule("\u0903"))
 
-        return text
+        return rules
 
     def get_char_stats(self, text):
         super(DevanagariNormalizer, self).get_char_stats(text)
@@ -465,15 +561,27 @@ class GurmukhiNormalizer(BaseNormalizer):
             self.addak_pattern = re.compile(r"\\u0a71(.)")
         self.visarga_pattern = re.compile(r"([\\u0a00-\\u0a7f]):")
 
-    def _normalize_vowels(self, text):
-        """ """
+    def get_rules(self):
+        rules = []
+
+        # Addak
+        if self.do_canonicalize_addak:
+            ## replace addak+consonant with consonat+halant+consonant
+            rules.append((SUB, self.addak_pattern, "\\\\1\\u0a4d\\\\1", None))
+
+        # Tippi
+        if self.do_canonicalize_tippi:
+            rules.append((REPLACE, "\u0a70", "\u0a02"))
+
+        # Vowels: Gurumuki has multiple ways of representing independent vowels due
+        # to the characters 'iri' and 'ura'.
 
         ## standard vowel replacements as per suggestions in
         ## http://www.unicode.org/versions/Unicode12.1.0/ch12.pdf
         ## Table 12-16
-
-        for k, v in GurmukhiNormalizer.VOWEL_NORM_MAPS.items():
-            text = text.replace(k, v)
+        rules.extend(
+            (REPLACE, k, v) for k, v in GurmukhiNormalizer.VOWEL_NORM_MAPS.items()
+        )
 
         ## the above mappings should account for majority of the variantions,
         ## Rest are handled via this generic rule which looks at the diacritic
@@ -483,51 +591,40 @@ class GurmukhiNormalizer(BaseNormalizer):
         ## If these special characters occur without any diacritic, replace them with closet
         ## equivalent vowels
         if self.do_replace_vowel_bases:
-            text = text.replace("\u0a72", "\u0a07")
-            text = text.replace("\u0a73", "\u0a09")
-
-        return text
-
-    def normalize(self, text):
-        # Addak
-        if self.do_canonicalize_addak:
-            ## replace addak+consonant with consonat+halant+consonant
-            text = self.addak_pattern.sub("\\\\1\\u0a4d\\\\1", text)
-
-        # Tippi
-        if self.do_canonicalize_tippi:
-            text = text.replace("\u0a70", "\u0a02")
-
-        # Vowels: Gurumuki has multiple ways of representing independent vowels due
-        # to the characters 'iri' and 'ura'.
-        text = self._normalize_vowels(text)
+            rules.append((REPLACE, "\u0a72", "\u0a07"))
+            rules.append((REPLACE, "\u0a73", "\u0a09"))
 
         # common normalization for Indic scripts
-        text = super(GurmukhiNormalizer, self).normalize(text)
+        rules.extend(super(GurmukhiNormalizer, self).get_rules())
 
         # decomposing Nukta based composite characters
-        text = text.replace("\u0a33", "\u0a32" + GurmukhiNormalizer.NUKTA)
-        text = text.replace("\u0a36", "\u0a38" + GurmukhiNormalizer.NUKTA)
-        text = text.replace("\u0a59", "\u0a16" + GurmukhiNormalizer.NUKTA)
-        text = text.replace("\u0a5a", "\u0a17" + GurmukhiNormalizer.NUKTA)
-        text = text.replace("\u0a5b", "\u0a1c" + GurmukhiNormalizer.NUKTA)
-        text = text.replace("\u0a5e", "\u0a2b" + GurmukhiNormalizer.NUKTA)
+        rules.extend(
+            (REPLACE, c, base + GurmukhiNormalizer.NUKTA)
+            for c, base in [
+                ("\u0a33", "\u0a32"),
+                ("\u0a36", "\u0a38"),
+                ("\u0a59", "\u0a16"),
+                ("\u0a5a", "\u0a17"),
+                ("\u0a5b", "\u0a1c"),
+                ("\u0a5e", "\u0a2b"),
+            ]
+        )
 
         if self.remove_nuktas:
-            text = text.replace(GurmukhiNormalizer.NUKTA, "")
+            rules.append((REPLACE, GurmukhiNormalizer.NUKTA, ""))
 
         # replace the poorna virama codes specific to script
         # with generic Indic script codes
-        text = text.replace("\u0a64", "\u0964")
-        text = text.replace("\u0a65", "\u0965")
+        rules.append((REPLACE, "\u0a64", "\u0964"))
+        rules.append((REPLACE, "\u0a65", "\u0965"))
 
         ## replace pipe character for poorna virama
-        text = text.replace("\u007c", "\u0964")
+        rules.append((REPLACE, "\u007c", "\u0964"))
 
         # correct visarge
-        text = self.visarga_pattern.sub("\\\\1\\u0a03", text)
+        rules.append(self._get_visarga_rule("\u0a03"))
 
-        return text
+        return rules
 
 
 class GujaratiNormalizer(BaseNormalizer):
@@ -556,23 +653,23 @@ class GujaratiNormalizer(BaseNormalizer):
         )
         self.visarga_pattern = re.compile(r"([\\u0a80-\\u0aff]):")
 
-    def normalize(self, text):
+    def get_rules(self):
         # common normalization for Indic scripts
-        text = super(GujaratiNormalizer, self).normalize(text)
+        rules = super(GujaratiNormalizer, self).get_rules()
 
         # decomposing Nukta based composite characters
         if self.remove_nuktas:
-            text = text.replace(GujaratiNormalizer.NUKTA, "")
+            rules.append((REPLACE, GujaratiNormalizer.NUKTA, ""))
 
         # replace the poorna virama codes specific to script
         # with generic Indic script codes
-        text = text.replace("\u0ae4", "\u0964")
-        text = text.replace("\u0ae5", "\u0965")
+        rules.append((REPLACE, "\u0ae4", "\u0964"))
+        rules.append((REPLACE, "\u0ae5", "\u0965"))
 
         # correct visarge
-        text = self.visarga_pattern.sub("\\\\1\\u0a83", text)
+        rules.append(self._get_visarga_rule("\u0a83"))
 
-        return text
+        return rules
 
 
 class OriyaNormalizer(BaseNormalizer):
@@ -614,52 +711,53 @@ class OriyaNormalizer(BaseNormalizer):
         self.do_remap_wa = do_remap_wa
         self.visarga_pattern = re.compile(r"([\\u0b00-\\u0b7f]):")
 
-    def normalize(self, text):
+    def get_rules(self):
         # common normalization for Indic scripts
-        text = super(OriyaNormalizer, self).normalize(text)
+        rules = super(OriyaNormalizer, self).get_rules()
 
         ## standard vowel replacements as per suggestions in Unicode documents
-        for k, v in OriyaNormalizer.VOWEL_NORM_MAPS.items():
-            text = text.replace(k, v)
+        rules.extend(
+            (REPLACE, k, v) for k, v in OriyaNormalizer.VOWEL_NORM_MAPS.items()
+        )
 
         # decomposing Nukta based composite characters
-        text = text.replace("\u0b5c", "\u0b21" + OriyaNormalizer.NUKTA)
-        text = text.replace("\u0b5d", "\u0b22" + OriyaNormalizer.NUKTA)
+        rules.append((REPLACE, "\u0b5c", "\u0b21" + OriyaNormalizer.NUKTA))
+        rules.append((REPLACE, "\u0b5d", "\u0b22" + OriyaNormalizer.NUKTA))
 
         if self.remove_nuktas:
-            text = text.replace(OriyaNormalizer.NUKTA, "")
+            rules.append((REPLACE, OriyaNormalizer.NUKTA, ""))
 
         # replace the poorna virama codes specific to script
         # with generic Indic script codes
-        text = text.replace("\u0b64", "\u0964")
-        text = text.replace("\u0b65", "\u0965")
+        rules.append((REPLACE, "\u0b64", "\u0964"))
+        rules.append((REPLACE, "\u0b65", "\u0965"))
 
         # replace pipe character for poorna virama
-        text = text.replace("\u0b7c", "\u0964")
+        rules.append((REPLACE, "\u0b7c", "\u0964"))
 
         # replace wa with ba
         if self.do_remap_wa:
-            text = text.replace("\u0b71", "\u0b2c")
+            rules.append((REPLACE, "\u0b71", "\u0b2c"))
 
         # replace va with ba
         # NOTE: documentation (chapter on Indic scripts) and codepoint chart seem contradictory
         # (this applied to wa to ba rule also above)
-        text = text.replace("\u0b35", "\u0b2c")
+        rules.append((REPLACE, "\u0b35", "\u0b2c"))
 
         # AI dependent vowel sign
-        text = text.replace("\u0b47\u0b56", "\u0b58")
+        rules.append((REPLACE, "\u0b47\u0b56", "\u0b58"))
 
         # two part dependent vowels
-        text = text.replace("\u0b47\u0b3e", "\u0b4b")
-        text = text.replace("\u0b47\u0b57", "\u0b4c")
+        rules.append((REPLACE, "\u0b47\u0b3e", "\u0b4b"))
+        rules.append((REPLACE, "\u0b47\u0b57", "\u0b4c"))
 
         # additional consonant - not clear how to handle this
         # ignore
 
         # correct visarge
-        text = self.visarga_pattern.sub("\\\\1\\u0b03", text)
+        rules.append(self._get_visarga_rule("\u0b03"))
 
-        return text
+        return rules
 
 
 class BengaliNormalizer(BaseNormalizer):
@@ -693,40 +791,40 @@ class BengaliNormalizer(BaseNormalizer):
         self.do_remap_assamese_chars = do_remap_assamese_chars
         self.visarga_pattern = re.compile(r"([\\u0980-\\u09ff]):")
 
-    def normalize(self, text):
+    def get_rules(self):
         # common normalization for Indic scripts
-        text = super(BengaliNormalizer, self).normalize(text)
+        rules = super(BengaliNormalizer, self).get_rules()
 
         # decomposing Nukta based composite characters
-        text = text.replace("\u09dc", "\u09a1" + BengaliNormalizer.NUKTA)
-        text = text.replace("\u09dd", "\u09a2" + BengaliNormalizer.NUKTA)
-        text = text.replace("\u09df", "\u09af" + BengaliNormalizer.NUKTA)
+        rules.append((REPLACE, "\u09dc", "\u09a1" + BengaliNormalizer.NUKTA))
+        rules.append((REPLACE, "\u09dd", "\u09a2" + BengaliNormalizer.NUKTA))
+        rules.append((REPLACE, "\u09df", "\u09af" + BengaliNormalizer.NUKTA))
 
         if self.remove_nuktas:
-            text = text.replace(BengaliNormalizer.NUKTA, "")
+            rules.append((REPLACE, BengaliNormalizer.NUKTA, ""))
 
         if self.do_remap_assamese_chars and self.lang == "as":
-            text = text.replace("\u09f0", "\u09b0")  #  'ra' character
-            text = text.replace("\u09f1", "\u09ac")  #  'va' character
+            rules.append((REPLACE, "\u09f0", "\u09b0"))  #  'ra' character
+            rules.append((REPLACE, "\u09f1", "\u09ac"))  #  'va' character
 
         # replace the poorna virama codes specific to script
         # with generic Indic script codes
-        text = text.replace("\u09e4", "\u0964")
-        text = text.replace("\u09e5", "\u0965")
+        rules.append((REPLACE, "\u09e4", "\u0964"))
+        rules.append((REPLACE, "\u09e5", "\u0965"))
 
         # replace pipe character for poorna virama
-        text = text.replace("\u007c", "\u0964")
+        rules.append((REPLACE, "\u007c", "\u0964"))
         # replace bengali currency numerator four for poorna virama  (it looks similar and is used as a substitute)
-        text = text.replace("\u09f7", "\u0964")
+        rules.append((REPLACE, "\u09f7", "\u0964"))
 
         # two part dependent vowels
-        text = text.replace("\u09c7\u09be", "\u09cb")
-        text = text.replace("\u09c7\u09d7", "\u09cc")
+        rules.append((REPLACE, "\u09c7\u09be", "\u09cb"))
+        rules.append((REPLACE, "\u09c7\u09d7", "\u09cc"))
 
         # correct visarge
-        text = self.visarga_pattern.sub("\\\\1\\u0983", text)
+        rules.append(self._get_visarga_rule("\u0983"))
 
-        return text
+        return rules
 
 
 class TamilNormalizer(BaseNormalizer):
@@ -754,25 +852,25 @@ class TamilNormalizer(BaseNormalizer):
         )
         self.visarga_pattern = re.compile(r"([\\u0b80-\\u0bff]):")
 
-    def normalize(self, text):
+    def get_rules(self):
         # common normalization for Indic scripts
-        text = super(TamilNormalizer, self).normalize(text)
+        rules = super(TamilNormalizer, self).get_rules()
 
         # replace the poorna virama codes specific to script
         # with generic Indic script codes
-        text = text.replace("\u0be4", "\u0964")
-        text = text.replace("\u0be5", "\u0965")
+        rules.append((REPLACE, "\u0be4", "\u0964"))
+        rules.append((REPLACE, "\u0be5", "\u0965"))
 
         # two part dependent vowels
-        text = text.replace("\u0b92\u0bd7", "\u0b94")
-        text = text.replace("\u0bc6\u0bbe", "\u0bca")
-        text = text.replace("\u0bc7\u0bbe", "\u0bcb")
-        text = text.replace("\u0bc6\u0bd7", "\u0bcc")
+        rules.append((REPLACE, "\u0b92\u0bd7", "\u0b94"))
+        rules.append((REPLACE, "\u0bc6\u0bbe", "\u0bca"))
+        rules.append((REPLACE, "\u0bc7\u0bbe", "\u0bcb"))
+        rules.append((REPLACE, "\u0bc6\u0bd7", "\u0bcc"))
 
         # correct visarge
-        text = self.visarga_pattern.sub("\\\\1\\u0b83", text)
+        rules.append(self._get_visarga_rule("\u0b83"))
 
-        return text
+        return rules
 
 
 class TeluguNormalizer(BaseNormalizer):
@@ -800,22 +898,22 @@ class TeluguNormalizer(BaseNormalizer):
         )
         self.visarga_pattern = re.compile(r"([\\u0c00-\\u0c7f]):")
 
-    def normalize(self, text):
+    def get_rules(self):
         # common normalization for Indic scripts
-        text = super(TeluguNormalizer, self).normalize(text)
+        rules = super(TeluguNormalizer, self).get_rules()
 
         # replace the poorna virama codes specific to script
         # with generic Indic script codes
-        text = text.replace("\u0c64", "\u0964")
-        text = text.replace("\u0c65", "\u0965")
+        rules.append((REPLACE, "\u0c64", "\u0964"))
+        rules.append((REPLACE, "\u0c65", "\u0965"))
 
         # dependent vowels
-        text = text.replace("\u0c46\u0c56", "\u0c48")
+        rules.append((REPLACE, "\u0c46\u0c56", "\u0c48"))
 
         # correct visarge
-        text = self.visarga_pattern.sub("\\\\1\\u0c03", text)
+        rules.append(self._get_visarga_rule("\u0c03"))
 
-        return text
+        return rules
 
     def get_char_stats(self, text):
         pass
@@ -846,26 +944,26 @@ class KannadaNormalizer(BaseNormalizer):
         )
         self.visarga_pattern = re.compile(r"([\\u0c80-\\u0cff]):")
 
-    def normalize(self, text):
+    def get_rules(self):
         # common normalization for Indic scripts
-        text = super(KannadaNormalizer, self).normalize(text)
+        rules = super(KannadaNormalizer, self).get_rules()
 
         # replace the poorna virama codes specific to script
         # with generic Indic script codes
-        text = text.replace("\u0ce4", "\u0964")
-        text = text.replace("\u0ce5", "\u0965")
+        rules.append((REPLACE, "\u0ce4", "\u0964"))
+        rules.append((REPLACE, "\u0ce5", "\u0965"))
 
         # dependent vowels
-        text = text.replace("\u0cbf\u0cd5", "\u0cc0")
-        text = text.replace("\u0cc6\u0cd5", "\u0cc7")
-        text = text.replace("\u0cc6\u0cd6", "\u0cc8")
-        text = text.replace("\u0cc6\u0cc2", "\u0cca")
-        text = text.replace("\u0cca\u0cd5", "\u0ccb")
+        rules.append((REPLACE, "\u0cbf\u0cd5", "\u0cc0"))
+        rules.append((REPLACE, "\u0cc6\u0cd5", "\u0cc7"))
+        rules.append((REPLACE, "\u0cc6\u0cd6", "\u0cc8"))
+        rules.append((REPLACE, "\u0cc6\u0cc2", "\u0cca"))
+        rules.append((REPLACE, "\u0cca\u0cd5", "\u0ccb"))
 
         # correct visarge
-        text = self.visarga_pattern.sub("\\\\1\\u0c83", text)
+        rules.append(self._get_visarga_rule("\u0c83"))
 
-        return text
+        return rules
 
 
 class MalayalamNormalizer(BaseNormalizer):
@@ -886,14 +984,6 @@ class MalayalamNormalizer(BaseNormalizer):
         "\u0d7f": "\u0d15",
     }
 
-    def _canonicalize_chillus(self, text):
-        for chillu, char in MalayalamNormalizer.CHILLU_CHAR_MAP.items():
-            text = text.replace(chillu, "{}\u0d4d".format(char))
-        return text
-
-    def _correct_geminated_T(self, text):
-        return text.replace("\u0d31\u0d4d\u0d31", "\u0d1f\u0d4d\u0d1f")
-
     def __init__(
         self,
         lang="ml",
@@ -915,43 +1005,48 @@ class MalayalamNormalizer(BaseNormalizer):
         self.do_correct_geminated_T = do_correct_geminated_T
         self.visarga_pattern = re.compile(r"([\\u0d00-\\u0d7f]):")
 
-    def normalize(self, text):
+    def get_rules(self):
         # Change from old encoding of chillus (till Unicode 5.0) to new encoding
-        text = text.replace("\u0d23\u0d4d\u200d", "\u0d7a")
-        text = text.replace("\u0d28\u0d4d\u200d", "\u0d7b")
-        text = text.replace("\u0d30\u0d4d\u200d", "\u0d7c")
-        text = text.replace("\u0d32\u0d4d\u200d", "\u0d7d")
-        text = text.replace("\u0d33\u0d4d\u200d", "\u0d7e")
-        text = text.replace("\u0d15\u0d4d\u200d", "\u0d7f")
+        rules = [
+            (REPLACE, "\u0d23\u0d4d\u200d", "\u0d7a"),
+            (REPLACE, "\u0d28\u0d4d\u200d", "\u0d7b"),
+            (REPLACE, "\u0d30\u0d4d\u200d", "\u0d7c"),
+            (REPLACE, "\u0d32\u0d4d\u200d", "\u0d7d"),
+            (REPLACE, "\u0d33\u0d4d\u200d", "\u0d7e"),
+            (REPLACE, "\u0d15\u0d4d\u200d", "\u0d7f"),
+        ]
 
         # Normalize chillus
         if self.do_canonicalize_chillus:
-            text = self._canonicalize_chillus(text)
+            rules.extend(
+                (REPLACE, chillu, "{}\u0d4d".format(char))
+                for chillu, char in MalayalamNormalizer.CHILLU_CHAR_MAP.items()
+            )
 
         # common normalization for Indic scripts
-        text = super(MalayalamNormalizer, self).normalize(text)
+        rules.extend(super(MalayalamNormalizer, self).get_rules())
 
         # replace the poorna virama codes specific to script
         # with generic Indic script codes
-        text = text.replace("\u0d64", "\u0964")
-        text = text.replace("\u0d65", "\u0965")
+        rules.append((REPLACE, "\u0d64", "\u0964"))
+        rules.append((REPLACE, "\u0d65", "\u0965"))
 
         # dependent vowels
-        text = text.replace("\u0d46\u0d3e", "\u0d4a")
-        text = text.replace("\u0d47\u0d3e", "\u0d4b")
+        rules.append((REPLACE, "\u0d46\u0d3e", "\u0d4a"))
+        rules.append((REPLACE, "\u0d47\u0d3e", "\u0d4b"))
 
         # au forms
-        text = text.replace("\u0d46\u0d57", "\u0d4c")
-        text = text.replace("\u0d57", "\u0d4c")
+        rules.append((REPLACE, "\u0d46\u0d57", "\u0d4c"))
+        rules.append((REPLACE, "\u0d57", "\u0d4c"))
 
         # correct geminated T
         if self.do_correct_geminated_T:
-            text = self._correct_geminated_T(text)
+            rules.append((REPLACE, "\u0d31\u0d4d\u0d31", "\u0d1f\u0d4d\u0d1f"))
 
         # correct visarga
-        text = self.visarga_pattern.sub("\\\\1\\u0d03", text)
+        rules.append(self._get_visarga_rule("\u0d03"))
 
-        return text
+        return rules
 
 
 class UrduNormalizer(NormalizerI):
@@ -984,17 +1079,22 @@ class UrduNormalizer(NormalizerI):
         self.normalize_characters = normalize_characters
         self.normalize_combine_characters = normalize_combine_characters
 
+        self._plan = RulePlan(self.get_rules())
+
     def normalize(self, text):
-        text = self._normalize_punctuations(text)
-        text = self.normalize_whitespace(text)
+        return self._plan.apply(text)
+
+    def get_rules(self):
+        rules = self._get_punctuation_rules()
+        rules.append((CALL, self.normalize_whitespace))
         if self.remove_nuktas:
-            text = self.remove_diacritics(text)
-        text = self.normalize_characters(text)
-        text = self.normalize_combine_characters(text)
-        text = self.digits_space(text)
-        text = self.all_punctuations_space(text)
-        text = self.english_characters_space(text)
-        return text
+            rules.append((CALL, self.remove_diacritics))
+        rules.append((CALL, self.normalize_characters))
+        rules.append((CALL, self.normalize_combine_characters))
+        rules.append((CALL, self.digits_space))
+        rules.append((CALL, self.all_punctuations_space))
+        rules.append((CALL, self.english_characters_space))
+        return rules
 
 
 class IndicNormalizerFactory(object):
@@ -1002,40 +1102,50 @@ class IndicNormalizerFactory(object):
     Factory class to create language specific normalizers.
     """
 
-    def get_normalizer(self, language, **kwargs):
-        """
-        Call the get_normalizer function to get the language specific normalizer
-        Paramters:
-        |language: language code
-        |remove_nuktas: boolean, should the normalizer remove nukta characters
-        """
-        normalizer = None
+    def _get_normalizer_class(self, language):
         if language in ["hi", "mr", "sa", "kK", "ne", "sd"]:
-            normalizer = DevanagariNormalizer(lang=language, **kwargs)
+            return DevanagariNormalizer
         elif language in ["ur"]:
-            normalizer = UrduNormalizer(lang=language, **kwargs)
+            return UrduNormalizer
         elif language in ["pa"]:
-            normalizer = GurmukhiNormalizer(lang=language, **kwargs)
+            return GurmukhiNormalizer
         elif language in ["gu"]:
-            normalizer = GujaratiNormalizer(lang=language, **kwargs)
+            return GujaratiNormalizer
         elif language in ["bn"]:
-            normalizer = BengaliNormalizer(lang=language, **kwargs)
+            return BengaliNormalizer
         elif language in ["as"]:
-            normalizer = BengaliNormalizer(lang=language, **kwargs)
+            return BengaliNormalizer
         elif language in ["or"]:
-            normalizer = OriyaNormalizer(lang=language, **kwargs)
+            return OriyaNormalizer
         elif language in ["ml"]:
-            normalizer = MalayalamNormalizer(lang=language, **kwargs)
+            return MalayalamNormalizer
         elif language in ["kn"]:
-            normalizer = KannadaNormalizer(lang=language, **kwargs)
+            return KannadaNormalizer
         elif language in ["ta"]:
-            normalizer = TamilNormalizer(lang=language, **kwargs)
+            return TamilNormalizer
         elif language in ["te"]:
-            normalizer = TeluguNormalizer(lang=language, **kwargs)
+            return TeluguNormalizer
         else:
-            normalizer = BaseNormalizer(lang=language, **kwargs)
+            return BaseNormalizer
 
-        return normalizer
+    def get_normalizer(self, language, **kwargs):
+        """
+        Call the get_normalizer function to get the language specific normalizer
+        Paramters:
+        |language: language code
+        |remove_nuktas: boolean, should the normalizer remove nukta characters
+        """
+        return self._get_normalizer_class(language)(lang=language, **kwargs)
+
+    def get_shared_normalizer(self, language, **kwargs):
+        """
+        Same as get_normalizer, but the normalizer is constructed once per process and
+        configuration, and shared by all the callers (see
+        `indicnlp.common.get_shared_instance`). It must not be modified.
+        """
+        return common.get_shared_instance(
+            self._get_normalizer_class(language), lang=language, **kwargs
+        )
 
     def is_language_supported(self, language):
         """
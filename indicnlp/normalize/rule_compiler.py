@@ -0,0 +1,343 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+"""
+Compiles the rewrite rules of a normalizer (see `BaseNormalizer.get_rules`) into a
+shorter sequence of equivalent passes over the text.
+
+A rule is one of:
+
+    (MAP, table)                      # str.translate with a {char: string} table
+    (REPLACE, old, new)               # str.replace
+    (SUB, pattern, repl, alphabet)    # pattern.sub(repl, text)
+    (CALL, function)                  # function(text), opaque to the compiler
+
+The alphabet of a SUB rule is the set of characters its pattern can match (None if
+unknown). Single character replacements are turned into maps, and maps are moved past
+the rules which do not read or write the characters they change, so that they can
+be merged: the rules of a script unifier and the transliteration to the common
+script collapse into a few passes. The compiled rules give the same output as the
+rules applied in order.
+"""
+
+import functools
+import re
+
+MAP = "map"
+REPLACE = "replace"
+SUB = "sub"
+CALL = "call"
+
+ASCII_CHARS = frozenset(chr(c) for c in range(128))
+
+# Maps are applied with str.replace, which skips over text without the character much
+# faster than str.translate. With more entries, a regex search for any of the
+# characters first skips the text that has none of them. Maps with more entries than
+# that (script tables, whose characters make up most of the text) use str.translate.
+_REPLACE_MAX_SIZE = 8
+_TRANSLATE_MIN_SIZE = 64
+
+# Runs of at least this many independent replacements of strings are applied with a
+# single regex alternation: below that, the str.replace calls are faster
+_ALTERNATION_MIN_SIZE = 8
+
+
+def _as_map(table):
+    """
+    Map with character keys and string values, without identity entries
+    """
+    result = {}
+    for c, v in table.items():
+        if isinstance(c, int):
+            c = chr(c)
+        if v is None:
+            v = ""
+        elif isinstance(v, int):
+            v = chr(v)
+        if v != c:
+            result[c] = v
+    return result
+
+
+def _translate(text, table):
+    return "".join([table.get(c, c) for c in text])
+
+
+def _compose(first, second):
+    """
+    Map applying first, then second
+    """
+    table = {c: _translate(v, second) for c, v in first.items()}
+    for c, v in second.items():
+        table.setdefault(c, v)
+    return {c: v for c, v in table.items() if v != c}
+
+
+def _map_chars(table):
+    chars = set()
+    for v in table.values():
+        chars.update(v)
+    return chars
+
+
+def _reads(rule):
+    if rule[0] == REPLACE:
+        return set(rule[1])
+    if rule[0] == SUB:
+        return rule[3]
+    return None
+
+
+def _writes(rule):
+    if rule[0] == REPLACE:
+        return set(rule[2])
+    if rule[0] == SUB and isinstance(rule[2], str):
+        return set(rule[2])
+    return None
+
+
+def _commutes(table, rule):
+    """
+    Can the map be applied on either side of rule, i.e. does rule only see characters
+    that the map neither changes nor produces?
+    """
+    reads = _reads(rule)
+    if reads is None or any(v == "" for v in table.values()):
+        return False
+    return reads.isdisjoint(table) and reads.isdisjoint(_map_chars(table))
+
+
+def _move_before(table, rule):
+    """
+    Returns the rule to apply after the map, giving the same result as the map
+    applied after rule, or None
+    """
+    if not _commutes(table, rule):
+        return None
+    if rule[0] == REPLACE:
+        return (REPLACE, rule[1], _translate(rule[2], table))
+    # the escapes and group references of a template are ASCII
+    if (
+        not isinstance(rule[2], str)
+        or not ASCII_CHARS.isdisjoint(table)
+        or "\\" in _map_chars(table)
+    ):
+        return None
+    return (SUB, rule[1], _translate(rule[2], table), rule[3])
+
+
+def _can_move_after(table, rule):
+    writes = _writes(rule)
+    return _commutes(table, rule) and writes is not None and writes.isdisjoint(table)
+
+
+def _merge_map(rules, i):
+    """
+    Merges the map rules[i] with the previous or next map, if the rules in between
+    allow it. Returns True if it was merged.
+    """
+    table = rules[i][1]
+
+    j = i - 1
+    moved = []
+    while j >= 0 and rules[j][0] != MAP:
+        rule = _move_before(table, rules[j])
+        if rule is None:
+            break
+        moved.append(rule)
+        j -= 1
+    else:
+        if j >= 0:
+            rules[j + 1 : i + 1] = [(MAP, _compose(rules[j][1], table))] + moved[::-1]
+            del rules[j]
+            return True
+
+    k = i + 1
+    while k < len(rules) and rules[k][0] != MAP:
+        if not _can_move_after(table, rules[k]):
+            return False
+        k += 1
+    if k < len(rules):
+        rules[k] = (MAP, _compose(table, rules[k][1]))
+        del rules[i]
+        return True
+    return False
+
+
+def _is_dead(rules, i):
+    """
+    Is the replacement rules[i] unable to match, because a character of its pattern
+    was removed from the text by an earlier map?
+    """
+    for c in set(rules[i][1]):
+        for rule in reversed(rules[:i]):
+            if rule[0] == MAP:
+                if c in rule[1]:
+                    if c not in _map_chars(rule[1]):
+                        return True
+                    break
+                if c in _map_chars(rule[1]):
+                    break
+            else:
+                writes = _writes(rule)
+                if writes is None or c in writes:
+                    break
+    return False
+
+
+def _overlaps(a, b):
+    """
+    Can occurrences of the strings a and b overlap in a text?
+    """
+    if a in b or b in a:
+        return True
+    return any(
+        a.endswith(b[:k]) or b.endswith(a[:k]) for k in range(1, min(len(a), len(b)))
+    )
+
+
+def _is_independent(group, rule):
+    """
+    Does applying the replacement rule after those of group give the same result as
+    applying them all in a single pass?
+    """
+    return all(
+        r[2] and set(r[2]).isdisjoint(rule[1]) and not _overlaps(r[1], rule[1])
+        for r in group
+    )
+
+
+def _replacement_function(table):
+    return lambda m: table[m.group()]
+
+
+def _merge_replacements(rules):
+    merged = []
+    group = []
+
+    def flush():
+        if len(group) >= _ALTERNATION_MIN_SIZE:
+            pattern = re.compile("|".join(re.escape(r[1]) for r in group))
+            table = {r[1]: r[2] for r in group}
+            alphabet = set("".join(table))
+            merged.append((SUB, pattern, _replacement_function(table), alphabet))
+        else:
+            merged.extend(group)
+        del group[:]
+
+    for rule in rules:
+        if rule[0] == REPLACE:
+            if not _is_independent(group, rule):
+                flush()
+            group.append(rule)
+        else:
+            flush()
+            merged.append(rule)
+    flush()
+
+    return merged
+
+
+def compile_rules(rules):
+    """
+    Returns an equivalent, usually shorter, list of rules
+    """
+    compiled = []
+    for rule in rules:
+        if rule[0] == REPLACE and len(rule[1]) == 1:
+            rule = (MAP, {rule[1]: rule[2]})
+        elif rule[0] == MAP:
+            rule = (MAP, _as_map(rule[1]))
+        compiled.append(rule)
+
+    merged = True
+    while merged:
+        merged = False
+        for i, rule in enumerate(compiled):
+            if rule[0] == MAP and _merge_map(compiled, i):
+                merged = True
+                break
+
+    compiled = [
+        rule
+        for i, rule in enumerate(compiled)
+        if not (rule[0] == MAP and not rule[1])
+        and not (rule[0] == REPLACE and _is_dead(compiled, i))
+    ]
+    return _merge_replacements(compiled)
+
+
+def _apply_replacements(items, text):
+    for old, new in items:
+        text = text.replace(old, new)
+    return text
+
+
+def _apply_translate(table, text):
+    return text.translate(table)
+
+
+def _apply_guarded_replacements(pattern, items, text):
+    if pattern.search(text) is None:
+        return text
+    return _apply_replacements(items, text)
+
+
+def _apply_map_sub(pattern, table, text):
+    return pattern.sub(lambda m: table[m.group()], text)
+
+
+def _apply_sub(pattern, repl, text):
+    return pattern.sub(repl, text)
+
+
+def _rule_function(rule):
+    if rule[0] == MAP:
+        table = rule[1]
+        if len(table) >= _TRANSLATE_MIN_SIZE:
+            return functools.partial(
+                _apply_translate, {ord(c): v for c, v in table.items()}
+            )
+
+        # the standard library re module scans character classes faster than regex
+        pattern = re.compile("[{}]".format("".join(map(re.escape, table))))
+        # replacing one character at a time is only the same as translating if no
+        # replacement contains a character replaced later
+        if not _map_chars(table).isdisjoint(table):
+            return functools.partial(_apply_map_sub, pattern, table)
+        if len(table) <= _REPLACE_MAX_SIZE:
+            return functools.partial(_apply_replacements, tuple(table.items()))
+        return functools.partial(
+            _apply_guarded_replacements, pattern, tuple(table.items())
+        )
+    if rule[0] == REPLACE:
+        return functools.partial(_apply_replacements, ((rule[1], rule[2]),))
+    if rule[0] == SUB:
+        return functools.partial(_apply_sub, rule[1], rule[2])
+    return rule[1]
+
+
+class RulePlan(object):
+    """
+    Compiled normalization rules
+    """
+
+    def __init__(self, rules):
+        """
+        rules: rules, in the order in which they are applied
+        """
+        self.rules = compile_rules(rules)
+        self._functions = [_rule_function(rule) for rule in self.rules]
+
+    def __len__(self):
+        return len(self.rules)
+
+    def apply(self, text):
+        for function in self._functions:
+            text = function(text)
+        return text
@@ -0,0 +1,92 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+"""
+Helpers to run the library functions over large collections of texts in a process pool.
+
+Texts are sent to the workers in chunks, to amortize the pickling and inter-process
+communication overhead over many (typically short) texts. Only a bounded number of
+chunks are in flight at a time, so input iterables are consumed lazily and results
+are produced in order.
+"""
+
+import itertools
+import multiprocessing
+import os
+from collections import deque
+
+from indicnlp import common
+from indicnlp import resource_cache
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Number of chunks submitted to the pool per worker, before waiting for results
+_CHUNKS_PER_JOB = 2
+
+
+def get_num_jobs(n_jobs):
+    """
+    Number of worker processes for n_jobs: None means 1, negative values count
+    back from the number of CPUs (-1 is all CPUs)
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, n_jobs)
+
+
+def _chunked(iterable, chunk_size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _init_worker(resources_path, cache_path):
+    # workers started with 'spawn' do not inherit the paths set in the parent process,
+    # the resources themselves are loaded lazily by each worker, once
+    common.set_resources_path(resources_path)
+    resource_cache.set_cache_path(cache_path)
+
+
+def imap_chunked(func, iterable, args=(), n_jobs=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yields the results of `func(chunk, *args)` for successive chunks (lists) of the
+    items of iterable, flattened and in order. func must return a list with one
+    result per item, and must be picklable (i.e. a module level function) if n_jobs > 1.
+
+    func: function processing a chunk of items
+    iterable: items
+    args: additional arguments of func
+    n_jobs: number of worker processes (see `get_num_jobs`). With a single job, the
+        chunks are processed in the calling process
+    chunk_size: number of items sent to a worker at a time
+    """
+    n_jobs = get_num_jobs(n_jobs)
+    chunks = _chunked(iterable, chunk_size)
+
+    if n_jobs == 1:
+        for chunk in chunks:
+            yield from func(chunk, *args)
+        return
+
+    with multiprocessing.Pool(
+        n_jobs,
+        initializer=_init_worker,
+        initargs=(common.get_resources_path(), resource_cache.get_cache_path()),
+    ) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(func, (chunk,) + tuple(args)))
+            if len(pending) >= _CHUNKS_PER_JOB * n_jobs:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
@@ -0,0 +1,139 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+"""
+Compiled cache for the CSV tables in the Indic NLP Resources directory.
+
+The first time a table is requested, the CSV file is parsed and the requested
+columns are saved as a `.npy` file in the cache directory. Subsequent requests
+(typically from other processes) memory map that file instead of parsing the CSV.
+The name of the cache file contains a checksum of the CSV contents and of the
+requested columns, so editing a CSV file automatically triggers a rebuild.
+"""
+
+import csv
+import hashlib
+import io
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from indicnlp.common import IndicNlpException
+
+# Bump this whenever the layout of the cache files changes
+CACHE_FORMAT_VERSION = 1
+
+_ENV_CACHE_PATH = os.environ.get("INDIC_CACHE_PATH")
+
+if _ENV_CACHE_PATH and _ENV_CACHE_PATH.strip():
+    INDIC_CACHE_PATH = _ENV_CACHE_PATH
+else:
+    INDIC_CACHE_PATH = os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache"),
+        "indicnlp",
+    )
+
+
+def get_cache_path():
+    """
+    Get the directory where compiled resource tables are stored
+    """
+    return INDIC_CACHE_PATH
+
+
+def set_cache_path(cache_path):
+    """
+    Set the directory where compiled resource tables are stored
+    """
+    global INDIC_CACHE_PATH
+    INDIC_CACHE_PATH = cache_path
+
+
+def _parse_csv(data, dtype, columns, start_column):
+    reader = csv.reader(io.StringIO(data.decode("utf-8")))
+    header = next(reader)
+
+    if columns is None:
+        indices = list(range(start_column, len(header)))
+    else:
+        indices = [header.index(c) for c in columns]
+
+    return np.array([[row[i] for i in indices] for row in reader], dtype=dtype)
+
+
+def _save(cache_fname, table):
+    """
+    Writes the table atomically, so that concurrent readers never see a partial file.
+    Failures (e.g. a read-only cache directory) are not fatal: the table is then just
+    not cached.
+    """
+    tmp_fname = None
+    try:
+        os.makedirs(os.path.dirname(cache_fname), exist_ok=True)
+        fd, tmp_fname = tempfile.mkstemp(dir=os.path.dirname(cache_fname), suffix=".tmp")
+        with os.fdopen(fd, "wb") as outfile:
+            np.save(outfile, table, allow_pickle=False)
+        os.replace(tmp_fname, cache_fname)
+    except OSError:
+        if tmp_fname is not None and os.path.exists(tmp_fname):
+            os.remove(tmp_fname)
+
+
+def load_table(csv_fname, dtype, columns=None, start_column=0):
+    """
+    Returns columns of a CSV resource file as a read-only 2D numpy array.
+
+    csv_fname: path to the CSV file (with a header row)
+    dtype: numpy dtype of the returned array, e.g. `np.int64` or `str`
+    columns: names of the columns to return. If None, all columns starting at index `start_column` are returned
+    start_column: see `columns`
+    """
+    with open(csv_fname, "rb") as infile:
+        data = infile.read()
+
+    checksum = hashlib.sha1(data)
+    checksum.update(repr((np.dtype(dtype).str, columns, start_column)).encode("utf-8"))
+
+    cache_fname = os.path.join(
+        get_cache_path(),
+        "{}.{}.v{}.npy".format(
+            os.path.splitext(os.path.basename(csv_fname))[0],
+            checksum.hexdigest()[:16],
+            CACHE_FORMAT_VERSION,
+        ),
+    )
+
+    try:
+        return np.load(cache_fname, mmap_mode="r", allow_pickle=False)
+    except (OSError, ValueError):
+        pass
+
+    table = _parse_csv(data, dtype, columns, start_column)
+    _save(cache_fname, table)
+    table.setflags(write=False)
+    return table
+
+
+def read_dataframe(csv_fname):
+    """
+    Reads a CSV resource file as a pandas DataFrame. pandas is an optional dependency
+    of the library and is only needed by the functions returning dataframes.
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        raise IndicNlpException(
+            "pandas is required to read {} as a DataFrame. "
+            "Install it with `pip install indic-nlp-library-itt[pandas]`".format(
+                os.path.basename(csv_fname)
+            )
+        )
+
+    return pd.read_csv(csv_fname, encoding="utf-8")
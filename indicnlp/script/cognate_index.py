@@ -0,0 +1,148 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+"""
+Approximate top-k cognate search over the LCSR space.
+
+A `CognateIndex` is built over the vocabulary of one Indic language. It answers
+queries for the words most similar (by `indic_scripts.lcsr_indic`) to a word of
+any Indic language:
+
+    index = CognateIndex(hindi_words, "hi")
+    index.query("தமிழ்", "ta", k=5)
+
+Words are projected into the coordinated offset space shared by the Brahmi
+derived scripts (the one used by `UnicodeIndicTransliterator`), so words of
+different scripts can be compared. Candidates are the words sharing the most
+character n-grams with the query, after discarding those whose length alone
+rules out the required score. Only the candidates are rescored with the exact
+LCSR, so a true top-k word that shares few n-grams with the query can be missed.
+"""
+
+import numpy as np
+
+from indicnlp.script import indic_scripts as isc
+
+# Padding key added at both ends of a word, so that n-grams also capture the word boundaries
+_BOUNDARY_KEY = -1
+
+
+def _ngrams(keys, ngram_order):
+    padding = [_BOUNDARY_KEY] * (ngram_order - 1)
+    padded = padding + keys + padding
+    return {
+        tuple(padded[i : i + ngram_order])
+        for i in range(len(padded) - ngram_order + 1)
+    }
+
+
+class CognateIndex(object):
+    """
+    Inverted index from character n-grams (in the coordinated offset space) to the
+    words of a vocabulary
+    """
+
+    def __init__(self, words, lang, ngram_order=2):
+        """
+        words: vocabulary to index
+        lang: language of the vocabulary
+        ngram_order: order of the character n-grams used to select candidates
+        """
+        self.words = list(words)
+        self.lang = lang
+        self.ngram_order = ngram_order
+
+        self._keys = [isc.lcsr_indic_keys(w, lang) for w in self.words]
+        self._lengths = np.array([len(k) for k in self._keys], dtype=np.int64)
+
+        self._ngram_ids = {}
+        ngram_ids = []
+        word_ids = []
+        for word_id, keys in enumerate(self._keys):
+            if not keys:
+                continue
+            for ngram in _ngrams(keys, ngram_order):
+                ngram_id = self._ngram_ids.setdefault(ngram, len(self._ngram_ids))
+                ngram_ids.append(ngram_id)
+                word_ids.append(word_id)
+
+        # postings of n-gram i: self._postings[self._postings_start[i]:self._postings_start[i+1]]
+        ngram_ids = np.array(ngram_ids, dtype=np.int64)
+        order = np.argsort(ngram_ids, kind="stable")
+        self._postings = np.array(word_ids, dtype=np.int64)[order]
+        self._postings_start = np.zeros(len(self._ngram_ids) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(ngram_ids, minlength=len(self._ngram_ids)),
+            out=self._postings_start[1:],
+        )
+
+    def __len__(self):
+        return len(self.words)
+
+    def _candidates(self, keys, min_score, max_candidates):
+        postings = []
+        for ngram in _ngrams(keys, self.ngram_order):
+            ngram_id = self._ngram_ids.get(ngram)
+            if ngram_id is not None:
+                start, end = self._postings_start[ngram_id : ngram_id + 2]
+                postings.append(self._postings[start:end])
+        if not postings:
+            return np.zeros(0, dtype=np.int64)
+
+        word_ids, shared = np.unique(np.concatenate(postings), return_counts=True)
+
+        # LCSR can not exceed the ratio of the shorter to the longer word length
+        lengths = self._lengths[word_ids]
+        bound = np.minimum(lengths, len(keys)) / np.maximum(lengths, len(keys))
+        keep = bound >= min_score
+        word_ids, shared = word_ids[keep], shared[keep]
+
+        if len(word_ids) > max_candidates:
+            top = np.argpartition(-shared, max_candidates - 1)[:max_candidates]
+            word_ids = word_ids[top]
+        return word_ids
+
+    def query(self, word, lang, k=10, min_score=0.0, max_candidates=200):
+        """
+        Returns the (approximately) k most similar words of the vocabulary as a list of
+        (word, LCSR score) pairs, best first. Ties are broken by vocabulary order.
+
+        word: query word
+        lang: language of the query word
+        k: number of words to return
+        min_score: words with a lower LCSR score are not returned
+        max_candidates: number of words sharing the most n-grams with the query which
+            are rescored with the exact LCSR
+        """
+        keys = isc.lcsr_indic_keys(word, lang)
+        if not keys:
+            return []
+
+        word_ids = self._candidates(keys, min_score, max(k, max_candidates))
+
+        masks = isc.lcs_match_masks(keys)
+        scores = [
+            isc.lcs_length(masks, len(keys), self._keys[word_id])
+            / float(max(len(keys), self._lengths[word_id]))
+            for word_id in word_ids
+        ]
+
+        results = sorted(zip(scores, word_ids), key=lambda x: (-x[0], x[1]))
+        return [
+            (self.words[word_id], score)
+            for score, word_id in results[:k]
+            if score >= min_score
+        ]
+
+    def query_batch(self, words, lang, k=10, min_score=0.0, max_candidates=200):
+        """
+        Runs `query` for each of the words, returns the list of results
+        """
+        return [
+            self.query(word, lang, k, min_score, max_candidates) for word in words
+        ]
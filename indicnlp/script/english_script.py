@@ -7,54 +7,78 @@
 #
 
 import os
-import pandas as pd
 import numpy as np
 
 from indicnlp import common
+from indicnlp import resource_cache
 from indicnlp.script import phonetic_constants as pc
 
-# Maps from ARPABET to Internal Id
-ARPABET_ID_MAP = {}
-ID_ARPABET_MAP = {}
+###
+# The tables below are loaded lazily: they are read from the resources directory
+# the first time they are accessed (or all at once by init()).
+###
 
+# ARPABET_ID_MAP, ID_ARPABET_MAP: Maps from ARPABET to Internal Id and back
 
-# Phonetic Information about script characters
-ENGLISH_PHONETIC_DATA = None
-
-ENGLISH_PHONETIC_VECTORS = None
+# ENGLISH_PHONETIC_DATA, ENGLISH_PHONETIC_VECTORS, ENGLISH_PHONETIC_VALIDITY: Phonetic Information about script characters
+#
+# The vectors and validity flags are read from the compiled resource cache (see
+# indicnlp.resource_cache). ENGLISH_PHONETIC_DATA needs pandas, which is an optional
+# dependency, and is only read if it is explicitly requested.
 
 # Use phonetic vector length from constants, allow override during init
 PHONETIC_VECTOR_LENGTH = pc.DEFAULT_PHONETIC_VECTOR_LENGTH
 
+ENGLISH_PHONETIC_DATA_FNAME = "english_script_phonetic_data.csv"
 
-def init():
+
+def _phonetic_data_path():
+    return os.path.join(
+        common.get_resources_path(), "script", ENGLISH_PHONETIC_DATA_FNAME
+    )
+
+
+def _set_english_phonetic_table(table):
     """
-    To be called by library loader, do not call it in your program
+    Installs the phonetic table: the validity flags followed by the phonetic vectors, as a single array
     """
+    global ENGLISH_PHONETIC_VALIDITY, ENGLISH_PHONETIC_VECTORS, PHONETIC_VECTOR_LENGTH
 
-    global ENGLISH_PHONETIC_DATA, ENGLISH_PHONETIC_VECTORS, PHONETIC_VECTOR_LENGTH
+    phonetic_vectors = table[
+        :, pc.PHONETIC_VECTOR_START_OFFSET - pc.PHONETIC_VALIDITY_OFFSET :
+    ]
 
-    ENGLISH_PHONETIC_DATA = pd.read_csv(
-        os.path.join(
-            common.get_resources_path(), "script", "english_script_phonetic_data.csv"
-        ),
-        encoding="utf-8",
+    # Update the phonetic vector length based on the loaded data
+    PHONETIC_VECTOR_LENGTH = phonetic_vectors.shape[1]
+
+    ENGLISH_PHONETIC_VALIDITY = table[:, 0]
+    ENGLISH_PHONETIC_VECTORS = phonetic_vectors
+
+
+def _load_english_phonetic_tables():
+    _set_english_phonetic_table(
+        resource_cache.load_table(
+            _phonetic_data_path(),
+            np.int64,
+            start_column=pc.PHONETIC_VALIDITY_OFFSET,
+        )
     )
 
-    ENGLISH_PHONETIC_VECTORS = ENGLISH_PHONETIC_DATA.iloc[
-        :, pc.PHONETIC_VECTOR_START_OFFSET :
-    ].values
 
-    # Update the phonetic vector length based on the loaded data
-    if ENGLISH_PHONETIC_VECTORS is not None:
-        PHONETIC_VECTOR_LENGTH = ENGLISH_PHONETIC_VECTORS.shape[1]
-    else:
-        # Fallback or error handling if vectors are not loaded
-        PHONETIC_VECTOR_LENGTH = pc.DEFAULT_PHONETIC_VECTOR_LENGTH
+def _load_english_phonetic_data():
+    global ENGLISH_PHONETIC_DATA
+    ENGLISH_PHONETIC_DATA = resource_cache.read_dataframe(_phonetic_data_path())
 
-    ### Load mapping from ARPABET representation of phoneme to internal ID
+
+def _load_arpabet_maps():
+    """
+    Load mapping from ARPABET representation of phoneme to internal ID
+    """
     global ARPABET_ID_MAP, ID_ARPABET_MAP
 
+    arpabet_id_map = {}
+    id_arpabet_map = {}
+
     with open(
         os.path.join(common.get_resources_path(), "script", "english_arpabet_list.csv"),
         "r",
@@ -62,16 +86,55 @@ def init():
     ) as infile:
         for ph_id, name in enumerate(iter(infile)):
             name = name.strip()
-            ARPABET_ID_MAP[name] = ph_id
-            ID_ARPABET_MAP[ph_id] = name
+            arpabet_id_map[name] = ph_id
+            id_arpabet_map[ph_id] = name
+
+    ID_ARPABET_MAP = id_arpabet_map
+    ARPABET_ID_MAP = arpabet_id_map
+
+
+_RESOURCE_LOADERS = {
+    "ENGLISH_PHONETIC_VALIDITY": _load_english_phonetic_tables,
+    "ENGLISH_PHONETIC_VECTORS": _load_english_phonetic_tables,
+    "ENGLISH_PHONETIC_DATA": _load_english_phonetic_data,
+    "ARPABET_ID_MAP": _load_arpabet_maps,
+    "ID_ARPABET_MAP": _load_arpabet_maps,
+}
+
+# Tables loaded by init(): the dataframe is left out since it needs pandas
+_EAGER_RESOURCES = [
+    "ENGLISH_PHONETIC_VALIDITY",
+    "ENGLISH_PHONETIC_VECTORS",
+    "ARPABET_ID_MAP",
+    "ID_ARPABET_MAP",
+]
+
+
+def _get_resource(name):
+    return common.load_lazy_resource(globals(), name, _RESOURCE_LOADERS[name])
+
+
+def __getattr__(name):
+    if name in _RESOURCE_LOADERS:
+        return _get_resource(name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def init():
+    """
+    To be called by library loader, do not call it in your program.
+    Eagerly loads the tables, which are otherwise loaded on first access.
+    """
+    for name in _EAGER_RESOURCES:
+        _get_resource(name)
 
 
 def phoneme_to_offset(ph):
-    return ARPABET_ID_MAP[ph]
+    return _get_resource("ARPABET_ID_MAP")[ph]
 
 
 def offset_to_phoneme(ph_id):
-    return ID_ARPABET_MAP[ph_id]
+    return _get_resource("ID_ARPABET_MAP")[ph_id]
 
 
 def phoneme_to_enc(ph):
@@ -93,10 +156,18 @@ def in_range(offset):
 def get_phonetic_info(
     lang,
 ):  # lang parameter is kept for API consistency if called from generic code
-    return (ENGLISH_PHONETIC_DATA, ENGLISH_PHONETIC_VECTORS)
+    """
+    Returns the phonetic data (a pandas DataFrame, requires pandas) and the phonetic vectors
+    """
+    return (
+        _get_resource("ENGLISH_PHONETIC_DATA"),
+        _get_resource("ENGLISH_PHONETIC_VECTORS"),
+    )
 
 
 def invalid_vector():
+    # the vector length is only known once the phonetic data has been loaded
+    _get_resource("ENGLISH_PHONETIC_VECTORS")
     return pc.get_invalid_vector(PHONETIC_VECTOR_LENGTH)
 
 
@@ -106,10 +177,7 @@ def get_phonetic_feature_vector(p, lang):  # lang parameter is kept for API cons
     if not in_range(offset):
         return invalid_vector()
 
-    # Since this is english_script, we directly use its phonetic data
-    # phonetic_data, phonetic_vectors = get_phonetic_info(lang) # Not needed
-
-    if ENGLISH_PHONETIC_DATA.iloc[offset]["Valid Vector Representation"] == 0:
+    if _get_resource("ENGLISH_PHONETIC_VALIDITY")[offset] == 0:
         return invalid_vector()
 
-    return ENGLISH_PHONETIC_VECTORS[offset]
+    return _get_resource("ENGLISH_PHONETIC_VECTORS")[offset]
@@ -6,30 +6,32 @@
 #  LICENSE file in the root directory of this source tree.
 #
 
-import pandas as pd
 import numpy as np
 import os
 
 from indicnlp import common
+from indicnlp import resource_cache
 from indicnlp.common import IndicNlpException
 from indicnlp import langinfo as li
 from indicnlp.script import phonetic_constants as pc
 
 ###
 # Phonetic Information about script characters
+#
+# The tables below are loaded lazily: they are read from the resources directory
+# the first time they are accessed (or all at once by init()).
 ###
 
-""" Phonetic data about all languages except Tamil """
-ALL_PHONETIC_DATA = None
-
-""" Phonetic data for Tamil """
-TAMIL_PHONETIC_DATA = None
-
-""" Phonetic vector for all languages except Tamil """
-ALL_PHONETIC_VECTORS = None
-
-""" Phonetic vector for Tamil """
-TAMIL_PHONETIC_VECTORS = None
+# ALL_PHONETIC_DATA: Phonetic data about all languages except Tamil
+# TAMIL_PHONETIC_DATA: Phonetic data for Tamil
+# ALL_PHONETIC_VECTORS: Phonetic vector for all languages except Tamil
+# TAMIL_PHONETIC_VECTORS: Phonetic vector for Tamil
+# ALL_PHONETIC_VALIDITY: 'Valid Vector Representation' flag for all languages except Tamil
+# TAMIL_PHONETIC_VALIDITY: 'Valid Vector Representation' flag for Tamil
+#
+# The vectors and validity flags are read from the compiled resource cache (see
+# indicnlp.resource_cache). The *_PHONETIC_DATA dataframes need pandas, which is an
+# optional dependency, and are only read if they are explicitly requested.
 
 # Use phonetic vector length from constants, allow override during init
 PHONETIC_VECTOR_LENGTH = pc.DEFAULT_PHONETIC_VECTOR_LENGTH
@@ -44,60 +46,139 @@ PHONETIC_VECTOR_LENGTH = pc.DEFAULT_PHONETIC_VECTOR_LENGTH
 SCRIPT_OFFSET_START = 0
 SCRIPT_OFFSET_RANGE = 0x80
 
+ALL_PHONETIC_DATA_FNAME = "all_script_phonetic_data.csv"
+TAMIL_PHONETIC_DATA_FNAME = "tamil_script_phonetic_data.csv"
 
-def init():
+
+def _phonetic_data_path(fname):
+    return os.path.join(common.get_resources_path(), "script", fname)
+
+
+def _read_phonetic_table(fname):
+    """
+    Returns the validity flags followed by the phonetic vectors from a phonetic data file, as a single array
+    """
+    return resource_cache.load_table(
+        _phonetic_data_path(fname),
+        np.int64,
+        start_column=pc.PHONETIC_VALIDITY_OFFSET,
+    )
+
+
+def _split_phonetic_table(table):
+    return (
+        table[:, 0],
+        table[:, pc.PHONETIC_VECTOR_START_OFFSET - pc.PHONETIC_VALIDITY_OFFSET :],
+    )
+
+
+def _set_all_phonetic_table(table):
+    """
+    Installs the phonetic table (see `_read_phonetic_table`) for all languages except Tamil
+    """
+    global ALL_PHONETIC_VALIDITY, ALL_PHONETIC_VECTORS, PHONETIC_VECTOR_LENGTH
+
+    phonetic_validity, phonetic_vectors = _split_phonetic_table(table)
+
+    # Update the phonetic vector length based on the loaded data (all_script has the representative length)
+    if phonetic_vectors.shape[1] > 0:
+        PHONETIC_VECTOR_LENGTH = phonetic_vectors.shape[1]
+
+    ALL_PHONETIC_VALIDITY = phonetic_validity
+    ALL_PHONETIC_VECTORS = phonetic_vectors
+
+
+def _set_tamil_phonetic_table(table):
     """
-    To be called by library loader, do not call it in your program
+    Installs the phonetic table (see `_read_phonetic_table`) for Tamil
     """
+    global TAMIL_PHONETIC_VALIDITY, TAMIL_PHONETIC_VECTORS
+
+    TAMIL_PHONETIC_VALIDITY, TAMIL_PHONETIC_VECTORS = _split_phonetic_table(table)
+
+
+def _load_all_phonetic_tables():
+    _set_all_phonetic_table(_read_phonetic_table(ALL_PHONETIC_DATA_FNAME))
 
-    global ALL_PHONETIC_DATA, ALL_PHONETIC_VECTORS, TAMIL_PHONETIC_DATA, TAMIL_PHONETIC_VECTORS, PHONETIC_VECTOR_LENGTH
 
-    ALL_PHONETIC_DATA = pd.read_csv(
-        os.path.join(
-            common.get_resources_path(), "script", "all_script_phonetic_data.csv"
-        ),
-        encoding="utf-8",
+def _load_tamil_phonetic_tables():
+    _set_tamil_phonetic_table(_read_phonetic_table(TAMIL_PHONETIC_DATA_FNAME))
+
+
+def _load_all_phonetic_data():
+    global ALL_PHONETIC_DATA
+    ALL_PHONETIC_DATA = resource_cache.read_dataframe(
+        _phonetic_data_path(ALL_PHONETIC_DATA_FNAME)
     )
-    TAMIL_PHONETIC_DATA = pd.read_csv(
-        os.path.join(
-            common.get_resources_path(), "script", "tamil_script_phonetic_data.csv"
-        ),
-        encoding="utf-8",
+
+
+def _load_tamil_phonetic_data():
+    global TAMIL_PHONETIC_DATA
+    TAMIL_PHONETIC_DATA = resource_cache.read_dataframe(
+        _phonetic_data_path(TAMIL_PHONETIC_DATA_FNAME)
     )
 
-    ALL_PHONETIC_VECTORS = ALL_PHONETIC_DATA.iloc[
-        :, pc.PHONETIC_VECTOR_START_OFFSET :
-    ].values
-    TAMIL_PHONETIC_VECTORS = TAMIL_PHONETIC_DATA.iloc[
-        :, pc.PHONETIC_VECTOR_START_OFFSET :
-    ].values
-
-    # Update the phonetic vector length based on the loaded data (assuming all_script has the representative length)
-    if ALL_PHONETIC_VECTORS is not None and ALL_PHONETIC_VECTORS.shape[1] > 0:
-        PHONETIC_VECTOR_LENGTH = ALL_PHONETIC_VECTORS.shape[1]
-    elif TAMIL_PHONETIC_VECTORS is not None and TAMIL_PHONETIC_VECTORS.shape[1] > 0:
-        PHONETIC_VECTOR_LENGTH = TAMIL_PHONETIC_VECTORS.shape[1]
-    else:
-        PHONETIC_VECTOR_LENGTH = pc.DEFAULT_PHONETIC_VECTOR_LENGTH
+
+_RESOURCE_LOADERS = {
+    "ALL_PHONETIC_VALIDITY": _load_all_phonetic_tables,
+    "ALL_PHONETIC_VECTORS": _load_all_phonetic_tables,
+    "TAMIL_PHONETIC_VALIDITY": _load_tamil_phonetic_tables,
+    "TAMIL_PHONETIC_VECTORS": _load_tamil_phonetic_tables,
+    "ALL_PHONETIC_DATA": _load_all_phonetic_data,
+    "TAMIL_PHONETIC_DATA": _load_tamil_phonetic_data,
+}
+
+# Tables loaded by init(): the dataframes are left out since they need pandas
+_EAGER_RESOURCES = [
+    "ALL_PHONETIC_VALIDITY",
+    "ALL_PHONETIC_VECTORS",
+    "TAMIL_PHONETIC_VALIDITY",
+    "TAMIL_PHONETIC_VECTORS",
+]
+
+
+def _get_resource(name):
+    return common.load_lazy_resource(globals(), name, _RESOURCE_LOADERS[name])
+
+
+def __getattr__(name):
+    if name in _RESOURCE_LOADERS:
+        return _get_resource(name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def init():
+    """
+    To be called by library loader, do not call it in your program.
+    Eagerly loads the phonetic tables, which are otherwise loaded on first access.
+    """
+    for name in _EAGER_RESOURCES:
+        _get_resource(name)
 
 
 def is_supported_language(lang):
-    return lang in list(li.SCRIPT_RANGES.keys())
+    return lang in li.SUPPORTED_LANGUAGES
 
 
-def get_offset(c, lang):
-    if not is_supported_language(lang):
+def get_script_descriptor(lang):
+    """
+    Returns the `langinfo.ScriptDescriptor` of a supported language
+    """
+    try:
+        return li.SCRIPT_DESCRIPTORS[lang]
+    except KeyError:
         raise IndicNlpException("Language {}  not supported".format(lang))
-    return ord(c) - li.SCRIPT_RANGES[lang][0]
+
+
+def get_offset(c, lang):
+    return ord(c) - get_script_descriptor(lang).base
 
 
 def offset_to_char(off, lang):
     """
     Applicable to Brahmi derived Indic scripts
     """
-    if not is_supported_language(lang):
-        raise IndicNlpException("Language {}  not supported".format(lang))
-    return chr(off + li.SCRIPT_RANGES[lang][0])
+    return chr(off + get_script_descriptor(lang).base)
 
 
 def is_indiclang_char(c, lang):
@@ -105,9 +186,7 @@ def is_indiclang_char(c, lang):
     Applicable to Brahmi derived Indic scripts
     Note that DANDA and DOUBLE_DANDA have the same Unicode codepoint for all Indic scripts
     """
-    if not is_supported_language(lang):
-        raise IndicNlpException("Language {}  not supported".format(lang))
-    o = get_offset(c, lang)
+    o = ord(c) - get_script_descriptor(lang).base
     return (
         (o >= SCRIPT_OFFSET_START and o < SCRIPT_OFFSET_RANGE)
         or ord(c) == li.DANDA
@@ -126,35 +205,73 @@ def in_coordinated_range_offset(c_offset):
 
 
 def in_coordinated_range(c, lang):
-    if not is_supported_language(lang):
-        raise IndicNlpException("Language {}  not supported".format(lang))
-    return in_coordinated_range_offset(get_offset(c, lang))
+    descriptor = get_script_descriptor(lang)
+    o = ord(c) - descriptor.base
+    return (
+        o >= SCRIPT_OFFSET_START
+        and o < SCRIPT_OFFSET_RANGE
+        and descriptor.valid_offsets[o] == 1
+    )
 
 
 def get_phonetic_info(lang):
+    """
+    Returns the phonetic data (a pandas DataFrame, requires pandas) and the phonetic vectors for a language
+    """
     if not is_supported_language(lang):
         raise IndicNlpException("Language {}  not supported".format(lang))
-    phonetic_data = ALL_PHONETIC_DATA if lang != li.LC_TA else TAMIL_PHONETIC_DATA
-    phonetic_vectors = (
-        ALL_PHONETIC_VECTORS if lang != li.LC_TA else TAMIL_PHONETIC_VECTORS
-    )
+    if lang != li.LC_TA:
+        return (
+            _get_resource("ALL_PHONETIC_DATA"),
+            _get_resource("ALL_PHONETIC_VECTORS"),
+        )
+    else:
+        return (
+            _get_resource("TAMIL_PHONETIC_DATA"),
+            _get_resource("TAMIL_PHONETIC_VECTORS"),
+        )
 
-    return (phonetic_data, phonetic_vectors)
+
+def _get_phonetic_tables(lang):
+    """
+    Returns the validity flags and the phonetic vectors for the script of a language
+    """
+    if lang != li.LC_TA:
+        return (
+            _get_resource("ALL_PHONETIC_VALIDITY"),
+            _get_resource("ALL_PHONETIC_VECTORS"),
+        )
+    else:
+        return (
+            _get_resource("TAMIL_PHONETIC_VALIDITY"),
+            _get_resource("TAMIL_PHONETIC_VECTORS"),
+        )
+
+
+def get_phonetic_vector_length():
+    # the vector length is only known once the phonetic data has been loaded
+    _get_resource("ALL_PHONETIC_VECTORS")
+    return PHONETIC_VECTOR_LENGTH
 
 
 def invalid_vector():
-    return pc.get_invalid_vector(PHONETIC_VECTOR_LENGTH)
+    return pc.get_invalid_vector(get_phonetic_vector_length())
 
 
 def get_phonetic_feature_vector(c, lang):
-    offset = get_offset(c, lang)
+    descriptor = get_script_descriptor(lang)
+    offset = ord(c) - descriptor.base
 
-    if not in_coordinated_range_offset(offset):
+    if not (
+        offset >= SCRIPT_OFFSET_START
+        and offset < SCRIPT_OFFSET_RANGE
+        and descriptor.valid_offsets[offset] == 1
+    ):
         return invalid_vector()
 
-    phonetic_data, phonetic_vectors = get_phonetic_info(lang)
+    phonetic_validity, phonetic_vectors = _get_phonetic_tables(lang)
 
-    if phonetic_data.iloc[offset]["Valid Vector Representation"] == 0:
+    if phonetic_validity[offset] == 0:
         return invalid_vector()
 
     return phonetic_vectors[offset]
@@ -164,17 +281,72 @@ def get_phonetic_feature_vector_offset(offset, lang):
     if not in_coordinated_range_offset(offset):
         return invalid_vector()
 
-    phonetic_data, phonetic_vectors = get_phonetic_info(lang)
+    if not is_supported_language(lang):
+        raise IndicNlpException("Language {}  not supported".format(lang))
+    phonetic_validity, phonetic_vectors = _get_phonetic_tables(lang)
 
-    if offset >= len(phonetic_data.index):
+    if offset >= len(phonetic_validity):
         return invalid_vector()
 
-    if phonetic_data.iloc[offset]["Valid Vector Representation"] == 0:
+    if phonetic_validity[offset] == 0:
         return invalid_vector()
 
     return phonetic_vectors[offset]
 
 
+def get_phonetic_feature_matrix_offset(offsets, lang):
+    """
+    Vectorized version of `get_phonetic_feature_vector_offset`: returns a
+    (len(offsets) x PHONETIC_VECTOR_LENGTH) array whose i-th row is the phonetic
+    feature vector of offsets[i]
+
+    offsets: sequence (or numpy array) of offsets
+    lang: language
+    """
+    if not is_supported_language(lang):
+        raise IndicNlpException("Language {}  not supported".format(lang))
+    phonetic_validity, phonetic_vectors = _get_phonetic_tables(lang)
+
+    offsets = np.asarray(offsets, dtype=np.int64)
+
+    valid = (
+        (offsets >= li.COORDINATED_RANGE_START_INCLUSIVE)
+        & (offsets <= li.COORDINATED_RANGE_END_INCLUSIVE)
+        & (offsets < len(phonetic_validity))
+    )
+    valid[valid] = phonetic_validity[offsets[valid]] != 0
+
+    features = np.zeros(
+        (len(offsets), phonetic_vectors.shape[1]), dtype=phonetic_vectors.dtype
+    )
+    features[valid] = phonetic_vectors[offsets[valid]]
+
+    return features
+
+
+def get_phonetic_feature_matrix(text, lang):
+    """
+    Vectorized version of `get_phonetic_feature_vector` for whole strings: returns a
+    (number of characters x PHONETIC_VECTOR_LENGTH) array whose i-th row is the
+    phonetic feature vector of the i-th character
+
+    text: a string, or a list of strings. For a list, the rows of all the strings are
+        concatenated (the rows of a string start at the sum of the lengths of the
+        preceding strings)
+    lang: language
+    """
+    if not is_supported_language(lang):
+        raise IndicNlpException("Language {}  not supported".format(lang))
+
+    if not isinstance(text, str):
+        text = "".join(text)
+
+    codepoints = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    return get_phonetic_feature_matrix_offset(
+        codepoints.astype(np.int64) - get_script_descriptor(lang).base, lang
+    )
+
+
 ### Unary operations on vectors
 def is_valid(v):
     return np.sum(v) > 0
@@ -216,11 +388,85 @@ def is_plosive(v):
 
 
 def or_vectors(v1, v2):
-    return np.array([1 if (b1 + b2) >= 1 else 0 for b1, b2 in zip(v1, v2)])
+    return np.logical_or(v1, v2).astype(np.int64)
 
 
 def xor_vectors(v1, v2):
-    return np.array([1 if b1 != b2 else 0 for b1, b2 in zip(v1, v2)])
+    return np.not_equal(v1, v2).astype(np.int64)
+
+
+### Bit-packed phonetic vectors
+#
+# A phonetic vector is packed into a single uint64, with bit i set if feature i is 1.
+# Arrays of packed vectors can be combined with the numpy bitwise operators (or the
+# functions below) and compared with `popcount`, see the *_packed functions in phonetic_sim.
+
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def pack_vectors(vectors):
+    """
+    Packs a phonetic vector, or an array of phonetic vectors (one per row), into
+    uint64 values. Returns a numpy uint64 scalar for a single vector.
+    """
+    vectors = np.asarray(vectors)
+    if vectors.shape[-1] > 64:
+        raise IndicNlpException("Cannot pack phonetic vectors with more than 64 features")
+    bits = np.left_shift(np.uint64(1), np.arange(vectors.shape[-1], dtype=np.uint64))
+    return np.bitwise_or.reduce(np.where(vectors != 0, bits, np.uint64(0)), axis=-1)
+
+
+def unpack_vectors(packed, length=None):
+    """
+    Inverse of `pack_vectors`, returns 0/1 int64 phonetic vectors
+
+    length: number of features, defaults to the phonetic vector length
+    """
+    if length is None:
+        length = get_phonetic_vector_length()
+    packed = np.asarray(packed, dtype=np.uint64)
+    shifts = np.arange(length, dtype=np.uint64)
+    return ((packed[..., np.newaxis] >> shifts) & np.uint64(1)).astype(np.int64)
+
+
+def and_packed(p1, p2):
+    return np.bitwise_and(p1, p2)
+
+
+def or_packed(p1, p2):
+    return np.bitwise_or(p1, p2)
+
+
+def xor_packed(p1, p2):
+    return np.bitwise_xor(p1, p2)
+
+
+if hasattr(np, "bitwise_count"):
+
+    def popcount(packed):
+        """
+        Number of features set in packed phonetic vectors, element-wise
+        """
+        return np.bitwise_count(np.asarray(packed, dtype=np.uint64)).astype(np.int64)
+
+else:
+
+    def popcount(packed):
+        """
+        Number of features set in packed phonetic vectors, element-wise
+        """
+        packed = np.asarray(packed, dtype=np.uint64)
+        flat = np.ascontiguousarray(packed.reshape(-1))
+        counts = _POPCOUNT_TABLE[flat.view(np.uint8)]
+        return counts.reshape(packed.shape + (8,)).sum(axis=-1, dtype=np.int64)
+
+
+def get_packed_phonetic_feature_matrix(text, lang):
+    """
+    Packed version of `get_phonetic_feature_matrix`: returns a uint64 array with the
+    packed phonetic vector of each character
+    """
+    return pack_vectors(get_phonetic_feature_matrix(text, lang))
 
 
 ### Getting properties from phonetic vectors
@@ -245,6 +491,70 @@ def get_property_value(v, prop_name):
     return int(v)
 
 
+### Longest Common Subsequence Ratio (LCSR)
+#
+# The LCS length is computed with the bit-parallel algorithm of Allison-Dix/Hyyro:
+# the matches of each symbol of the first sequence are stored as a bitmask (Python
+# ints, so words of any length are supported) and each symbol of the second sequence
+# updates a bit-vector of the LCS row in a few integer operations.
+#
+# lcsr_indic_keys, lcs_match_masks and lcs_length are public, for callers scoring one
+# word against many others (e.g. `indicnlp.script.cognate_index`): the keys and the
+# masks of a word can be computed once.
+
+
+def lcsr_indic_keys(word, lang):
+    """
+    Maps the characters of a word to integer keys, such that two characters are
+    equal for `lcsr_indic` iff their keys are equal: characters in the coordinated
+    range are mapped to their offset, the others to their codepoint shifted past
+    the script offsets
+    """
+    base = get_script_descriptor(lang).base
+    keys = []
+    for c in word:
+        o = ord(c) - base
+        keys.append(o if in_coordinated_range_offset(o) else ord(c) + SCRIPT_OFFSET_RANGE)
+    return keys
+
+
+def lcs_match_masks(seq):
+    """
+    Bitmasks of the positions of each symbol of a sequence (a list of keys, or a
+    string), the first argument of `lcs_length`
+    """
+    masks = {}
+    for i, k in enumerate(seq):
+        masks[k] = masks.get(k, 0) | (1 << i)
+    return masks
+
+
+def lcs_length(masks, m, seq):
+    """
+    Length of the longest common subsequence of two sequences
+
+    masks: `lcs_match_masks` of the first sequence
+    m: length of the first sequence
+    seq: the second sequence
+    """
+    if m == 0:
+        return 0
+    full = (1 << m) - 1
+    v = full
+    for k in seq:
+        u = v & masks.get(k, 0)
+        v = ((v + u) | (v - u)) & full
+    return m - v.bit_count()
+
+
+def _lcsr_result(lcs_len, srcw, tgtw):
+    return (
+        np.float64(lcs_len) / float(max(len(srcw), len(tgtw))),
+        float(len(srcw)),
+        float(len(tgtw)),
+    )
+
+
 def lcsr_indic(srcw, tgtw, slang, tlang):
     """
     compute the Longest Common Subsequence Ratio (LCSR) between two strings at the character level.
@@ -255,31 +565,13 @@ def lcsr_indic(srcw, tgtw, slang, tlang):
     slang: source language
     tlang: target language
     """
-    score_mat = np.zeros((len(srcw) + 1, len(tgtw) + 1))
-
-    for si, sc in enumerate(srcw, 1):
-        for ti, tc in enumerate(tgtw, 1):
-            so = get_offset(sc, slang)
-            to = get_offset(tc, tlang)
-
-            if (
-                in_coordinated_range_offset(so)
-                and in_coordinated_range_offset(to)
-                and so == to
-            ):
-                score_mat[si, ti] = score_mat[si - 1, ti - 1] + 1.0
-            elif (
-                not (in_coordinated_range_offset(so) or in_coordinated_range_offset(to))
-                and sc == tc
-            ):
-                score_mat[si, ti] = score_mat[si - 1, ti - 1] + 1.0
-            else:
-                score_mat[si, ti] = max(score_mat[si, ti - 1], score_mat[si - 1, ti])
+    if not srcw or not tgtw:
+        return _lcsr_result(0, srcw, tgtw)
 
-    return (
-        score_mat[-1, -1] / float(max(len(srcw), len(tgtw))),
-        float(len(srcw)),
-        float(len(tgtw)),
+    src_keys = lcsr_indic_keys(srcw, slang)
+    tgt_keys = lcsr_indic_keys(tgtw, tlang)
+    return _lcsr_result(
+        lcs_length(lcs_match_masks(src_keys), len(src_keys), tgt_keys), srcw, tgtw
     )
 
 
@@ -287,19 +579,22 @@ def lcsr_any(srcw, tgtw):
     """
     LCSR computation if both languages have the same script
     """
-    score_mat = np.zeros((len(srcw) + 1, len(tgtw) + 1))
+    return _lcsr_result(lcs_length(lcs_match_masks(srcw), len(srcw), tgtw), srcw, tgtw)
 
-    for si, sc in enumerate(srcw, 1):
-        for ti, tc in enumerate(tgtw, 1):
-            if sc == tc:
-                score_mat[si, ti] = score_mat[si - 1, ti - 1] + 1.0
-            else:
-                score_mat[si, ti] = max(score_mat[si, ti - 1], score_mat[si - 1, ti])
 
+def _lcsr_key_functions(slang, tlang):
+    """
+    Functions mapping source and target words to the sequences compared by `lcsr`
+    """
+    if (
+        slang == tlang
+        or not is_supported_language(slang)
+        or not is_supported_language(tlang)
+    ):
+        return list, list
     return (
-        score_mat[-1, -1] / float(max(len(srcw), len(tgtw))),
-        float(len(srcw)),
-        float(len(tgtw)),
+        lambda w: lcsr_indic_keys(w, slang),
+        lambda w: lcsr_indic_keys(w, tlang),
     )
 
 
@@ -318,6 +613,56 @@ def lcsr(srcw, tgtw, slang, tlang):
         or not is_supported_language(slang)
         or not is_supported_language(tlang)
     ):
-        return lcsr_any(srcw, tgtw, slang, tlang)
+        return lcsr_any(srcw, tgtw)
     else:
-        return lcsr_indic(srcw, tgtw)
+        return lcsr_indic(srcw, tgtw, slang, tlang)
+
+
+def lcsr_batch(pairs, slang, tlang):
+    """
+    LCSR scores of many word pairs: returns a float64 array whose i-th value is
+    `lcsr(srcw, tgtw, slang, tlang)[0]` for the i-th pair (nan if both words are empty)
+
+    pairs: iterable of (srcw, tgtw) pairs
+    slang: source language
+    tlang: target language
+    """
+    src_key_func, tgt_key_func = _lcsr_key_functions(slang, tlang)
+    src_masks = {}
+
+    lcs_lens = []
+    max_lens = []
+    for srcw, tgtw in pairs:
+        if srcw not in src_masks:
+            src_masks[srcw] = lcs_match_masks(src_key_func(srcw))
+        lcs_lens.append(lcs_length(src_masks[srcw], len(srcw), tgt_key_func(tgtw)))
+        max_lens.append(max(len(srcw), len(tgtw)))
+
+    lcs_lens = np.array(lcs_lens, dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        return lcs_lens / np.array(max_lens, dtype=np.float64)
+
+
+def lcsr_matrix(srcws, tgtws, slang, tlang):
+    """
+    LCSR scores of all pairs of words of two lists: returns a float64 array of shape
+    (len(srcws), len(tgtws)) whose [i, j] value is `lcsr(srcws[i], tgtws[j], slang, tlang)[0]`
+
+    srcws: list of source language words
+    tgtws: list of target language words
+    slang: source language
+    tlang: target language
+    """
+    src_key_func, tgt_key_func = _lcsr_key_functions(slang, tlang)
+    tgt_keys = [tgt_key_func(tgtw) for tgtw in tgtws]
+    tgt_lens = np.array([len(tgtw) for tgtw in tgtws], dtype=np.float64)
+
+    lcs_lens = np.zeros((len(srcws), len(tgtws)), dtype=np.float64)
+    for i, srcw in enumerate(srcws):
+        masks = lcs_match_masks(src_key_func(srcw))
+        for j, keys in enumerate(tgt_keys):
+            lcs_lens[i, j] = lcs_length(masks, len(srcw), keys)
+
+    src_lens = np.array([len(srcw) for srcw in srcws], dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        return lcs_lens / np.maximum(src_lens[:, np.newaxis], tgt_lens[np.newaxis, :])
@@ -1,5 +1,8 @@
 import numpy as np
 
+# Offset of the 'Valid Vector Representation' flag in the phonetic data vector
+PHONETIC_VALIDITY_OFFSET = 5
+
 # Start offset for the phonetic feature vector in the phonetic data vector
 PHONETIC_VECTOR_START_OFFSET = 6
 
@@ -44,7 +44,136 @@ def softmax(v1, v2):
     return sim1(v1, v2, np.e)
 
 
+### Similarity of packed phonetic vectors (see indic_scripts.pack_vectors)
+#
+# These operate element-wise on arrays of packed vectors, with numpy broadcasting
+# (e.g. p1[:, np.newaxis] and p2[np.newaxis, :] for all pairs), and return float64
+# values equal to those of the corresponding functions above.
+
+
+def equal_packed(p1, p2):
+    return np.equal(p1, p2).astype(np.float64)
+
+
+def dotprod_packed(p1, p2):
+    return popcount(and_packed(p1, p2)).astype(np.float64)
+
+
+def dice_packed(p1, p2, length=None):
+    """
+    length: number of features, defaults to the phonetic vector length
+    """
+    if length is None:
+        length = get_phonetic_vector_length()
+    return 2 * dotprod_packed(p1, p2) / float(2 * length)
+
+
+def jaccard_packed(p1, p2, length=None):
+    """
+    length: number of features, defaults to the phonetic vector length
+    """
+    if length is None:
+        length = get_phonetic_vector_length()
+    dotprod = dotprod_packed(p1, p2)
+    return dotprod / (float(2 * length) - dotprod)
+
+
+### Vectorized similarity matrices
+#
+# The similarity of all pairs of rows of two arrays of phonetic vectors, computed with
+# a single matrix product. Each function gives the same values as the corresponding
+# scalar function applied to every pair.
+
+
+def _dotprod_matrix(m1, m2):
+    return np.dot(m1, m2.T).astype(np.float64)
+
+
+def _equal_matrix(m1, m2):
+    same = m1[:, np.newaxis, :] == m2[np.newaxis, :, :]
+    return np.all(same, axis=2).astype(np.float64)
+
+
+def _dice_matrix(m1, m2):
+    return 2 * _dotprod_matrix(m1, m2) / float(m1.shape[1] + m2.shape[1])
+
+
+def _jaccard_matrix(m1, m2):
+    dotprod = _dotprod_matrix(m1, m2)
+    return dotprod / (float(m1.shape[1] + m2.shape[1]) - dotprod)
+
+
+def _cosine_matrix(m1, m2):
+    dotprod = _dotprod_matrix(m1, m2)
+    norm1 = np.sum(m1 * m1, axis=1).astype(np.float64)
+    norm2 = np.sum(m2 * m2, axis=1).astype(np.float64)
+    return dotprod / (np.sqrt(norm1[:, np.newaxis] * norm2[np.newaxis, :]) + 0.00001)
+
+
+def _sim1_matrix(m1, m2, base=5.0):
+    return np.power(base, _dotprod_matrix(m1, m2))
+
+
+def _softmax_matrix(m1, m2):
+    return _sim1_matrix(m1, m2, np.e)
+
+
+_SIMILARITY_MATRIX_FUNCS = {
+    equal: _equal_matrix,
+    dice: _dice_matrix,
+    jaccard: _jaccard_matrix,
+    cosine: _cosine_matrix,
+    dotprod: _dotprod_matrix,
+    sim1: _sim1_matrix,
+    softmax: _softmax_matrix,
+}
+
+# Similarity matrices of the built-in metrics, keyed by (sim_func, slang, tlang, normalize)
+_SIMILARITY_MATRIX_CACHE = {}
+
+
+def clear_similarity_matrix_cache():
+    _SIMILARITY_MATRIX_CACHE.clear()
+
+
+def _coordinated_range_vectors(lang):
+    offsets = np.arange(
+        langinfo.COORDINATED_RANGE_START_INCLUSIVE,
+        langinfo.COORDINATED_RANGE_END_INCLUSIVE + 1,
+    )
+    return get_phonetic_feature_matrix_offset(offsets, lang)
+
+
 def create_similarity_matrix(sim_func, slang, tlang, normalize=True):
+    """
+    Returns the matrix of similarities (computed by sim_func) between the phonetic
+    vectors of the characters in the coordinated range of slang and tlang.
+
+    For the similarity functions of this module, the matrix is computed with numpy
+    array operations and memoized: a copy of the cached matrix is returned. Any other
+    sim_func is called on every pair of phonetic vectors.
+    """
+    matrix_func = _SIMILARITY_MATRIX_FUNCS.get(sim_func)
+    if matrix_func is None:
+        return _create_similarity_matrix_loop(sim_func, slang, tlang, normalize)
+
+    key = (sim_func, slang, tlang, normalize)
+    sim_mat = _SIMILARITY_MATRIX_CACHE.get(key)
+    if sim_mat is None:
+        sim_mat = matrix_func(
+            _coordinated_range_vectors(slang), _coordinated_range_vectors(tlang)
+        )
+
+        if normalize:
+            sums = np.sum(sim_mat, axis=1)
+            sim_mat = (sim_mat.transpose() / sums).transpose()
+
+        _SIMILARITY_MATRIX_CACHE[key] = sim_mat
+
+    return sim_mat.copy()
+
+
+def _create_similarity_matrix_loop(sim_func, slang, tlang, normalize=True):
     dim = (
         langinfo.COORDINATED_RANGE_END_INCLUSIVE
         - langinfo.COORDINATED_RANGE_START_INCLUSIVE
@@ -0,0 +1,153 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+"""
+Sharing of the phonetic tables across processes.
+
+A parent process publishes the phonetic tables of `indic_scripts` and
+`english_script` once into a `multiprocessing.shared_memory` block:
+
+    shm = shared_phonetic_tables.publish_phonetic_tables()
+
+and the worker processes attach to it (read-only) instead of loading their own
+copy, usually through the loader:
+
+    loader.load(shared_phonetic_tables=shm.name)
+
+The publisher owns the block and must call `shm.close()` and `shm.unlink()` once
+the workers are done. The workers never remove the block, whether they are
+`multiprocessing` children of the publisher or independent processes (e.g. started
+by a launcher). Note that without shared memory, the tables are read from
+the memory-mapped resource cache (see `indicnlp.resource_cache`), whose pages
+are also shared between processes by the operating system.
+"""
+
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from indicnlp.common import IndicNlpException
+from indicnlp.script import indic_scripts
+from indicnlp.script import english_script
+
+_MAGIC = 0x494E4C50  # 'INLP'
+_FORMAT_VERSION = 1
+
+# Order of the tables in the shared memory block, with the function installing each of them
+_TABLE_SETTERS = [
+    indic_scripts._set_all_phonetic_table,
+    indic_scripts._set_tamil_phonetic_table,
+    english_script._set_english_phonetic_table,
+]
+
+# Header: magic, version, number of tables, then (rows, columns) for each table
+_HEADER_LENGTH = 3 + 2 * len(_TABLE_SETTERS)
+
+# Shared memory blocks attached by this process, they must stay open while the tables are in use
+_ATTACHED_BLOCKS = []
+
+
+def _get_phonetic_tables():
+    """
+    Returns the phonetic tables (validity flags followed by the phonetic vectors) in block order
+    """
+    return [
+        np.column_stack([validity, vectors]).astype(np.int64)
+        for validity, vectors in [
+            (indic_scripts.ALL_PHONETIC_VALIDITY, indic_scripts.ALL_PHONETIC_VECTORS),
+            (
+                indic_scripts.TAMIL_PHONETIC_VALIDITY,
+                indic_scripts.TAMIL_PHONETIC_VECTORS,
+            ),
+            (
+                english_script.ENGLISH_PHONETIC_VALIDITY,
+                english_script.ENGLISH_PHONETIC_VECTORS,
+            ),
+        ]
+    ]
+
+
+def publish_phonetic_tables(name=None):
+    """
+    Copies the phonetic tables into a new shared memory block and returns the
+    `SharedMemory` object. Its `name` attribute is to be passed to the workers.
+
+    name: name of the shared memory block, a unique name is generated if None
+    """
+    tables = _get_phonetic_tables()
+
+    header = [_MAGIC, _FORMAT_VERSION, len(tables)]
+    for table in tables:
+        header.extend(table.shape)
+
+    size = 8 * (_HEADER_LENGTH + sum(table.size for table in tables))
+    shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+    buf = np.ndarray((size // 8,), dtype=np.int64, buffer=shm.buf)
+    buf[:_HEADER_LENGTH] = header
+    start = _HEADER_LENGTH
+    for table in tables:
+        buf[start : start + table.size] = table.ravel()
+        start += table.size
+
+    return shm
+
+
+def _open_block(name):
+    if sys.version_info >= (3, 13):
+        # only the publisher should be able to remove the block
+        return shared_memory.SharedMemory(name=name, track=False)
+
+    # older versions always register the block with the resource tracker of this
+    # process, which unlinks it when the process exits if the process does not share
+    # the tracker of the publisher. The registration is skipped instead.
+    register = resource_tracker.register
+
+    def _register(name, rtype):
+        if rtype != "shared_memory":
+            register(name, rtype)
+
+    resource_tracker.register = _register
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def attach_phonetic_tables(name):
+    """
+    Attaches to a shared memory block created by `publish_phonetic_tables` and uses
+    it, read-only, as the phonetic tables of this process.
+
+    name: name of the shared memory block
+    """
+    shm = _open_block(name)
+
+    header = np.ndarray((_HEADER_LENGTH,), dtype=np.int64, buffer=shm.buf).tolist()
+    if (
+        header[0] != _MAGIC
+        or header[1] != _FORMAT_VERSION
+        or header[2] != len(_TABLE_SETTERS)
+    ):
+        shm.close()
+        raise IndicNlpException(
+            "Shared memory block {} does not contain phonetic tables".format(name)
+        )
+
+    start = _HEADER_LENGTH
+    for i, set_table in enumerate(_TABLE_SETTERS):
+        rows, cols = header[3 + 2 * i : 5 + 2 * i]
+        table = np.ndarray(
+            (rows, cols), dtype=np.int64, buffer=shm.buf, offset=8 * start
+        )
+        table.setflags(write=False)
+        set_table(table)
+        start += rows * cols
+
+    _ATTACHED_BLOCKS.append(shm)
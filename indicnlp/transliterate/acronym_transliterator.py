@@ -12,8 +12,12 @@
 # @author Anoop Kunchukuttan
 #
 
+from indicnlp import langinfo
 from indicnlp.transliterate.unicode_transliterate import UnicodeIndicTransliterator
+from indicnlp.transliterate import transliteration_cache
+import functools
 import random
+import numpy as np
 
 
 class LatinToIndicAcronymTransliterator(object):
@@ -53,18 +57,28 @@ class LatinToIndicAcronymTransliterator(object):
     LATIN_ALPHABET = "abcdefghijklmnopqrstuvwxyz"
 
     @staticmethod
-    def get_transtable():
-        return LatinToIndicAcronymTransliterator.LATIN_TO_DEVANAGARI_TRANSTABLE
+    def get_transtable(lang=None):
+        """
+        Returns the `str.translate` table from lower case Latin letters to the script of
+        lang (Devanagari if lang is None). The table of a language also converts the
+        Devanagari characters to its script, like `UnicodeIndicTransliterator` does.
+        """
+        if lang is None:
+            return LatinToIndicAcronymTransliterator.LATIN_TO_DEVANAGARI_TRANSTABLE
+        return _get_latin_to_indic_transtable(lang)
 
     @staticmethod
     def transliterate(w, lang):
-        return UnicodeIndicTransliterator.transliterate(
-            w.lower().translate(
-                LatinToIndicAcronymTransliterator.LATIN_TO_DEVANAGARI_TRANSTABLE
-            ),
-            "hi",
-            lang,
-        )
+        cache = transliteration_cache.get_cache()
+        if cache is not None:
+            return cache.transliterate_words(
+                w, "en", lang, "acronym", _acronym_scheme
+            )
+        return LatinToIndicAcronymTransliterator._transliterate(w, lang)
+
+    @staticmethod
+    def _transliterate(w, lang):
+        return w.lower().translate(_get_latin_to_indic_transtable(lang))
 
     @staticmethod
     def generate_latin_acronyms(num_acronyms, min_len=2, max_len=6, strategy="random"):
@@ -82,3 +96,82 @@ class LatinToIndicAcronymTransliterator(object):
                 )
 
         return [sample_acronym(strategy) for i in range(num_acronyms)]
+
+    @staticmethod
+    def generate_latin_acronyms_bulk(num_acronyms, min_len=2, max_len=6, seed=None):
+        """
+        generate Latin acronyms in lower case, like `generate_latin_acronyms` (with the
+        'random' strategy) but sampled in bulk with a numpy random generator
+
+        seed: seed of the numpy random generator, or a `numpy.random.Generator`
+        """
+        rng = np.random.default_rng(seed)
+        lengths = rng.integers(min_len, max_len + 1, size=num_acronyms)
+        letters = rng.integers(0, 26, size=int(lengths.sum()), dtype=np.uint8)
+        text = (letters + ord("a")).tobytes().decode("ascii")
+
+        ends = np.cumsum(lengths).tolist()
+        return [text[start:end] for start, end in zip([0] + ends[:-1], ends)]
+
+    @staticmethod
+    def generate_acronym_pairs(num_acronyms, lang, min_len=2, max_len=6, seed=None):
+        """
+        generate (Latin acronym, transliteration in lang) pairs, see
+        `generate_latin_acronyms_bulk` for the arguments
+        """
+        latin = LatinToIndicAcronymTransliterator.generate_latin_acronyms_bulk(
+            num_acronyms, min_len, max_len, seed
+        )
+        # a single translate call for all the acronyms, which do not contain newlines
+        transtable = _get_latin_to_indic_transtable(lang)
+        indic = "\n".join(latin).translate(transtable).split("\n")
+        return list(zip(latin, indic))
+
+    @staticmethod
+    def write_acronym_pairs(
+        fname,
+        num_acronyms,
+        lang,
+        min_len=2,
+        max_len=6,
+        seed=None,
+        batch_size=100000,
+    ):
+        """
+        write generated (Latin acronym, transliteration in lang) pairs to a file, one
+        tab separated pair per line. The pairs are generated in batches of batch_size,
+        so that memory use does not depend on num_acronyms.
+        """
+        rng = np.random.default_rng(seed)
+        with open(fname, "w", encoding="utf-8") as outfile:
+            for start in range(0, num_acronyms, batch_size):
+                pairs = LatinToIndicAcronymTransliterator.generate_acronym_pairs(
+                    min(batch_size, num_acronyms - start), lang, min_len, max_len, rng
+                )
+                outfile.write(
+                    "".join(latin + "\t" + indic + "\n" for latin, indic in pairs)
+                )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_latin_to_indic_transtable(lang):
+    """
+    Composition of LATIN_TO_DEVANAGARI_TRANSTABLE with the Devanagari to lang
+    transliteration of `UnicodeIndicTransliterator`
+    """
+    table = {}
+    if lang in langinfo.SUPPORTED_LANGUAGES:
+        table.update(UnicodeIndicTransliterator.get_translation_table("hi", lang))
+
+    latin_table = LatinToIndicAcronymTransliterator.LATIN_TO_DEVANAGARI_TRANSTABLE
+    for c, devanagari in latin_table.items():
+        table[c] = UnicodeIndicTransliterator._transliterate(devanagari, "hi", lang)
+    return table
+
+
+def _acronym_scheme(word, src, tgt):
+    # uncached transliteration for the "acronym" scheme of the transliteration cache
+    return LatinToIndicAcronymTransliterator._transliterate(word, tgt)
+
+
+transliteration_cache.register_scheme("acronym", _acronym_scheme)
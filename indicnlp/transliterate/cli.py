@@ -0,0 +1,291 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+"""
+Command line interface for transliteration (the `indicnlp-transliterate` script).
+
+Transliterates text files (or stdin) line by line between Indic scripts, or between
+an Indic script and ITRANS:
+
+    indicnlp-transliterate -s hi -t ta corpus.hi.gz -o corpus.ta.gz
+    indicnlp-transliterate -s itrans -t hi < romanized.txt
+
+Files ending in .gz are read/written with gzip, files ending in .zst with zstd (this
+needs the `zstandard` package). With several jobs, uncompressed input files are split
+into shards by byte offset, each worker reading its own shards. Other inputs are
+sent to the workers in chunks of lines. Output is always in input order, and memory
+use is bounded by the number of shards or chunks in flight.
+"""
+
+import argparse
+import gzip
+import io
+import os
+import sys
+
+from indicnlp import langinfo
+from indicnlp import parallel
+from indicnlp.common import IndicNlpException
+from indicnlp.transliterate.unicode_transliterate import (
+    ItransTransliterator,
+    UnicodeIndicTransliterator,
+)
+
+ITRANS = "itrans"
+
+DEFAULT_SHARD_SIZE = 16 * 1024 * 1024
+
+_BUFFER_SIZE = 1024 * 1024
+
+
+def _transliterate_text(text, src, tgt):
+    if src == ITRANS:
+        return ItransTransliterator.from_itrans(text, tgt)
+    elif tgt == ITRANS:
+        return ItransTransliterator.to_itrans(text, src)
+    else:
+        return UnicodeIndicTransliterator.transliterate(text, src, tgt)
+
+
+def _transliterate_line(line, src, tgt, encoding):
+    """
+    Transliterates a line (bytes), keeping its line terminator
+    """
+    text = line.decode(encoding)
+    if text.endswith("\n"):
+        return (_transliterate_text(text[:-1], src, tgt) + "\n").encode(encoding)
+    return _transliterate_text(text, src, tgt).encode(encoding)
+
+
+def _transliterate_lines(lines, src, tgt, encoding):
+    return [_transliterate_line(line, src, tgt, encoding) for line in lines]
+
+
+def _transliterate_shards(shards, fname, src, tgt, encoding):
+    """
+    Transliterates the lines starting in the byte ranges [start, end) of a file,
+    returns the transliterated bytes of each range
+    """
+    out = []
+    with open(fname, "rb", buffering=_BUFFER_SIZE) as infile:
+        for start, end in shards:
+            if start > 0:
+                # skip the line started in the previous shard
+                infile.seek(start - 1)
+                infile.readline()
+            else:
+                infile.seek(0)
+
+            lines = []
+            while infile.tell() < end:
+                line = infile.readline()
+                if not line:
+                    break
+                lines.append(_transliterate_line(line, src, tgt, encoding))
+            out.append(b"".join(lines))
+    return out
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise IndicNlpException(
+            "The zstandard package is required to read and write .zst files"
+        )
+    return zstandard
+
+
+def _is_compressed(fname):
+    return fname.endswith(".gz") or fname.endswith(".zst")
+
+
+def _open_input(fname):
+    if fname == "-":
+        return sys.stdin.buffer
+    if fname.endswith(".gz"):
+        return gzip.open(fname, "rb")
+    if fname.endswith(".zst"):
+        zstandard = _import_zstandard()
+        return io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(
+                open(fname, "rb"), closefd=True
+            ),
+            _BUFFER_SIZE,
+        )
+    return open(fname, "rb", buffering=_BUFFER_SIZE)
+
+
+def _open_output(fname):
+    if fname == "-":
+        return sys.stdout.buffer
+    if fname.endswith(".gz"):
+        return gzip.open(fname, "wb")
+    if fname.endswith(".zst"):
+        zstandard = _import_zstandard()
+        return io.BufferedWriter(
+            zstandard.ZstdCompressor().stream_writer(open(fname, "wb"), closefd=True),
+            _BUFFER_SIZE,
+        )
+    return open(fname, "wb", buffering=_BUFFER_SIZE)
+
+
+def _file_shards(fname, shard_size):
+    size = os.path.getsize(fname)
+    return [
+        (start, min(start + shard_size, size)) for start in range(0, size, shard_size)
+    ]
+
+
+def transliterate_file(
+    infname,
+    outfile,
+    src,
+    tgt,
+    n_jobs=1,
+    shard_size=DEFAULT_SHARD_SIZE,
+    chunk_size=parallel.DEFAULT_CHUNK_SIZE,
+    encoding="utf-8",
+):
+    """
+    Transliterates a file line by line, writing the result to a binary file object
+
+    infname: input file name, '-' for stdin
+    outfile: binary file object
+    src: source language, or 'itrans'
+    tgt: target language, or 'itrans'
+    n_jobs: number of worker processes, see `indicnlp.parallel.get_num_jobs`
+    shard_size: size in bytes of the shards of uncompressed input files, with several jobs
+    chunk_size: number of lines sent to a worker at a time, for the other inputs
+    encoding: encoding of the input and the output
+    """
+    n_jobs = parallel.get_num_jobs(n_jobs)
+
+    if n_jobs > 1 and infname != "-" and not _is_compressed(infname):
+        results = parallel.imap_chunked(
+            _transliterate_shards,
+            _file_shards(infname, shard_size),
+            args=(infname, src, tgt, encoding),
+            n_jobs=n_jobs,
+            chunk_size=1,
+        )
+        for data in results:
+            outfile.write(data)
+        return
+
+    infile = _open_input(infname)
+    try:
+        if n_jobs > 1:
+            results = parallel.imap_chunked(
+                _transliterate_lines,
+                infile,
+                args=(src, tgt, encoding),
+                n_jobs=n_jobs,
+                chunk_size=chunk_size,
+            )
+        else:
+            results = (_transliterate_line(line, src, tgt, encoding) for line in infile)
+
+        for data in results:
+            outfile.write(data)
+    finally:
+        if infile is not sys.stdin.buffer:
+            infile.close()
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        prog="indicnlp-transliterate",
+        description="Transliterate text line by line between Indic scripts, or between "
+        "an Indic script and ITRANS. Files ending in .gz or .zst are (de)compressed.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        default=["-"],
+        help="input files, '-' for stdin (default)",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="output file, '-' for stdout (default)"
+    )
+    parser.add_argument(
+        "-s", "--source", required=True, help="source language code, or 'itrans'"
+    )
+    parser.add_argument(
+        "-t", "--target", required=True, help="target language code, or 'itrans'"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes, -1 for all CPUs (default: 1)",
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=DEFAULT_SHARD_SIZE,
+        help="size in bytes of the shards of uncompressed input files "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=parallel.DEFAULT_CHUNK_SIZE,
+        help="number of lines sent to a worker at a time, for stdin and compressed "
+        "input files (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--encoding", default="utf-8", help="text encoding (default: %(default)s)"
+    )
+    return parser
+
+
+def _check_languages(parser, args):
+    """
+    Reports unsupported language codes as usage errors, before any file is opened
+    """
+    codes = sorted(langinfo.SUPPORTED_LANGUAGES) + [ITRANS]
+    for option, code in [("source", args.source), ("target", args.target)]:
+        if code not in codes:
+            parser.error(
+                "unsupported {} language code '{}' (choose from {})".format(
+                    option, code, ", ".join(codes)
+                )
+            )
+    if args.source == ITRANS and args.target == ITRANS:
+        parser.error("either the source or the target must be a language")
+
+
+def main(argv=None):
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    _check_languages(parser, args)
+
+    outfile = _open_output(args.output)
+    try:
+        for infname in args.inputs:
+            transliterate_file(
+                infname,
+                outfile,
+                args.source,
+                args.target,
+                n_jobs=args.jobs,
+                shard_size=args.shard_size,
+                chunk_size=args.chunk_size,
+                encoding=args.encoding,
+            )
+    finally:
+        if outfile is sys.stdout.buffer:
+            outfile.flush()
+        else:
+            outfile.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,9 +11,12 @@
 # @author Anoop Kunchukuttan
 #
 
+import functools
 import sys
 from indicnlp.normalize import indic_normalize
+from indicnlp.normalize import rule_compiler
 from indicnlp.transliterate import unicode_transliterate
+from indicnlp import langinfo
 from indicnlp import loader
 
 
@@ -28,11 +31,12 @@ class AggressiveScriptUnifier:
         self._init_normalizers()
 
     def _init_normalizers(self):
+        ## the normalizers are shared by all the unifiers with the same configuration
         normalizer_factory = indic_normalize.IndicNormalizerFactory()
 
         ## for languages with common parameters
         for lang in ["hi", "mr", "sa", "kK", "ne", "sd", "bn", "gu", "ta", "te", "kn"]:
-            self.normalizer_map[lang] = normalizer_factory.get_normalizer(
+            self.normalizer_map[lang] = normalizer_factory.get_shared_normalizer(
                 lang,
                 nasals_mode=self.nasals_mode,
                 do_normalize_chandras=self.do_normalize_chandras,
@@ -41,7 +45,7 @@ class AggressiveScriptUnifier:
             )
 
         ## for languages with language specific parameters
-        self.normalizer_map["pa"] = normalizer_factory.get_normalizer(
+        self.normalizer_map["pa"] = normalizer_factory.get_shared_normalizer(
             "pa",
             nasals_mode=self.nasals_mode,
             do_normalize_chandras=self.do_normalize_chandras,
@@ -51,7 +55,7 @@ class AggressiveScriptUnifier:
             do_canonicalize_tippi=True,
             do_replace_vowel_bases=True,
         )
-        self.normalizer_map["or"] = normalizer_factory.get_normalizer(
+        self.normalizer_map["or"] = normalizer_factory.get_shared_normalizer(
             "or",
             nasals_mode=self.nasals_mode,
             do_normalize_chandras=self.do_normalize_chandras,
@@ -59,7 +63,7 @@ class AggressiveScriptUnifier:
             do_normalize_vowel_ending=self.do_normalize_vowel_ending,
             do_remap_wa=True,
         )
-        self.normalizer_map["as"] = normalizer_factory.get_normalizer(
+        self.normalizer_map["as"] = normalizer_factory.get_shared_normalizer(
             "as",
             nasals_mode=self.nasals_mode,
             do_normalize_chandras=self.do_normalize_chandras,
@@ -67,7 +71,7 @@ class AggressiveScriptUnifier:
             do_normalize_vowel_ending=self.do_normalize_vowel_ending,
             do_remap_assamese_chars=True,
         )
-        self.normalizer_map["ml"] = normalizer_factory.get_normalizer(
+        self.normalizer_map["ml"] = normalizer_factory.get_shared_normalizer(
             "ml",
             nasals_mode=self.nasals_mode,
             do_normalize_chandras=self.do_normalize_chandras,
@@ -93,6 +97,7 @@ class BasicScriptUnifier:
         self._init_normalizers()
 
     def _init_normalizers(self):
+        ## the normalizers are shared by all the unifiers with the same configuration
         normalizer_factory = indic_normalize.IndicNormalizerFactory()
 
         for lang in [
@@ -112,7 +117,7 @@ class BasicScriptUnifier:
             "as",
             "ml",
         ]:
-            self.normalizer_map[lang] = normalizer_factory.get_normalizer(
+            self.normalizer_map[lang] = normalizer_factory.get_shared_normalizer(
                 lang, nasals_mode=self.nasals_mode
             )
 
@@ -135,3 +140,50 @@ class NaiveScriptUnifier:
             text, lang, self.common_lang
         )
         return text
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_plan(normalizer, lang, common_lang):
+    # the unifiers share their normalizers, so the plans are compiled once
+    rules = normalizer.get_rules()
+    if (
+        lang in langinfo.SUPPORTED_LANGUAGES
+        and common_lang in langinfo.SUPPORTED_LANGUAGES
+    ):
+        rules.append(
+            (
+                rule_compiler.MAP,
+                unicode_transliterate.UnicodeIndicTransliterator.get_translation_table(
+                    lang, common_lang
+                ),
+            )
+        )
+    return rule_compiler.RulePlan(rules)
+
+
+class CompiledScriptUnifier:
+    """
+    Gives the same output as the transform method of a script unifier
+    (`AggressiveScriptUnifier`, `BasicScriptUnifier` or `NaiveScriptUnifier`). The
+    normalization rules of each language and the transliteration to the common script
+    are compiled together into a `rule_compiler.RulePlan`, which makes fewer passes over
+    the text. The languages without a normalizer (all of them for `NaiveScriptUnifier`)
+    are transformed by the unifier itself.
+    """
+
+    def __init__(self, unifier):
+        """
+        unifier: AggressiveScriptUnifier, BasicScriptUnifier or NaiveScriptUnifier
+        """
+        self.unifier = unifier
+        self.common_lang = unifier.common_lang
+        self.plans = {}
+
+        for lang, normalizer in getattr(unifier, "normalizer_map", {}).items():
+            self.plans[lang] = _compile_plan(normalizer, lang, self.common_lang)
+
+    def transform(self, text, lang):
+        plan = self.plans.get(lang)
+        if plan is None:
+            return self.unifier.transform(text, lang)
+        return plan.apply(text)
@@ -0,0 +1,188 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+"""
+Word level memoization of the transliterators.
+
+The cache is disabled by default. Once enabled with `enable_cache()`, the
+transliterators (`UnicodeIndicTransliterator`, `ItransTransliterator` and
+`LatinToIndicAcronymTransliterator`) split their input on spaces and
+transliterate it word by word through a single LRU cache of bounded size,
+keyed by (word, source, target, scheme):
+
+    transliteration_cache.enable_cache(maxsize=500000)
+    transliteration_cache.warm_cache_from_file("vocab.txt", "hi", "ta", "unicode")
+    ...
+    transliteration_cache.get_cache_stats()
+
+The schemes are "unicode" (`UnicodeIndicTransliterator`), "itrans"
+(`ItransTransliterator`, with "itrans" as the source or target language) and
+"acronym" (`LatinToIndicAcronymTransliterator`, with "en" as the source).
+"""
+
+import threading
+from collections import OrderedDict
+
+from indicnlp.common import IndicNlpException
+
+DEFAULT_CACHE_SIZE = 100000
+
+# scheme -> function(word, source, target) computing the uncached transliteration,
+# registered by the modules defining the transliterators
+_SCHEMES = {}
+
+_CACHE = None
+
+
+def register_scheme(scheme, transliterate_func):
+    _SCHEMES[scheme] = transliterate_func
+
+
+class TransliterationCache(object):
+    """
+    Thread-safe LRU cache of word transliterations, keyed by (word, source, target, scheme)
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Returns the cached transliteration, or None
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def transliterate_words(self, text, src, tgt, scheme, transliterate_func):
+        """
+        Transliterates the space separated words of text through the cache
+
+        transliterate_func: function(word, src, tgt) computing an uncached transliteration.
+            It returns None if a word can not be transliterated independently of the
+            others, in which case None is returned
+        """
+        words = text.split(" ")
+        out = [None] * len(words)
+        missing = {}
+
+        with self._lock:
+            for i, word in enumerate(words):
+                key = (word, src, tgt, scheme)
+                value = self._entries.get(key)
+                if value is None:
+                    missing.setdefault(word, []).append(i)
+                else:
+                    self._entries.move_to_end(key)
+                    out[i] = value
+            num_missing = sum(len(indices) for indices in missing.values())
+            self.misses += num_missing
+            self.hits += len(words) - num_missing
+
+        for word, indices in missing.items():
+            value = transliterate_func(word, src, tgt)
+            if value is None:
+                return None
+            self.put((word, src, tgt, scheme), value)
+            for i in indices:
+                out[i] = value
+
+        return " ".join(out)
+
+    def warm(self, words, src, tgt, scheme):
+        """
+        Adds the transliterations of words to the cache, without updating the counters
+        """
+        transliterate_func = _SCHEMES[scheme]
+        for word in words:
+            value = transliterate_func(word, src, tgt)
+            if value is not None:
+                self.put((word, src, tgt, scheme), value)
+
+
+def enable_cache(maxsize=DEFAULT_CACHE_SIZE):
+    """
+    Enables the transliteration cache (replacing the current cache, if any), returns it
+
+    maxsize: maximum number of cached words
+    """
+    global _CACHE
+    _CACHE = TransliterationCache(maxsize)
+    return _CACHE
+
+
+def disable_cache():
+    global _CACHE
+    _CACHE = None
+
+
+def get_cache():
+    """
+    Returns the transliteration cache, or None if it is disabled
+    """
+    return _CACHE
+
+
+def get_cache_stats():
+    """
+    Returns the hits, misses, size and maxsize of the cache, or None if it is disabled
+    """
+    cache = _CACHE
+    return None if cache is None else cache.stats()
+
+
+def warm_cache_from_file(fname, src, tgt, scheme, encoding="utf-8"):
+    """
+    Adds the transliterations of the words of a vocabulary file (whitespace separated,
+    typically one per line) to the cache. The cache must be enabled.
+    """
+    cache = _CACHE
+    if cache is None:
+        raise IndicNlpException("The transliteration cache is not enabled")
+
+    # the module registering the scheme must have been imported
+    if scheme not in _SCHEMES:
+        raise IndicNlpException("Unknown transliteration scheme: {}".format(scheme))
+
+    with open(fname, "r", encoding=encoding) as infile:
+        for line in infile:
+            cache.warm(line.split(), src, tgt, scheme)
@@ -13,15 +13,18 @@
 
 import sys
 import os
+import functools
 from collections import defaultdict
 
+import numpy as np
+
 from indicnlp import common
+from indicnlp import parallel
+from indicnlp import resource_cache
 from indicnlp import langinfo
-from indicnlp.script import indic_scripts as isc
-import pandas as pd
+from indicnlp.transliterate import transliteration_cache
 
-OFFSET_TO_ITRANS = {}
-ITRANS_TO_OFFSET = defaultdict(list)
+# OFFSET_TO_ITRANS, ITRANS_TO_OFFSET and ITRANS_TRIE are loaded lazily on first access (or by init())
 
 # Moved from init() to module level
 DUPLICATE_ITRANS_REPRESENTATIONS = {
@@ -43,11 +46,7 @@ DUPLICATE_ITRANS_REPRESENTATIONS = {
 }
 
 
-def init():
-    """
-    To be called by library loader, do not call it in your program
-    """
-
+def _load_itrans_maps():
     ### Load the ITRANS-script offset map. The map was initially generated using the snippet below (uses the old itrans transliterator)
     ### The map is modified as needed to accomodate extensions and corrections to the mappings
     #
@@ -61,27 +60,69 @@ def init():
     #
     # pd.DataFrame(l,columns=['offset_hex','devnag_char','itrans']).to_csv('offset_itrans_map.csv',index=False,encoding='utf-8')
 
+    global OFFSET_TO_ITRANS, ITRANS_TO_OFFSET, ITRANS_TRIE
+
     itrans_map_fname = os.path.join(
         common.get_resources_path(), "transliterate", "offset_itrans_map.csv"
     )
-    itrans_df = pd.read_csv(itrans_map_fname, encoding="utf-8")
+    itrans_table = resource_cache.load_table(
+        itrans_map_fname, str, columns=["offset_hex", "itrans"]
+    )
 
-    global OFFSET_TO_ITRANS, ITRANS_TO_OFFSET  # DUPLICATE_ITRANS_REPRESENTATIONS removed from global modification
+    offset_to_itrans = {}
+    itrans_to_offset = defaultdict(list)
 
-    for r in itrans_df.iterrows():
-        itrans = r[1]["itrans"]
-        o = int(r[1]["offset_hex"], base=16)
+    for offset_hex, itrans in itrans_table.tolist():
+        o = int(offset_hex, base=16)
 
-        OFFSET_TO_ITRANS[o] = itrans
+        offset_to_itrans[o] = itrans
 
         if langinfo.is_consonant_offset(o):
             ### for consonants, strip the schwa - add halant offset
-            ITRANS_TO_OFFSET[itrans[:-1]].extend([o, 0x4D])
-        else:
+            itrans_to_offset[itrans[:-1]].extend([o, 0x4D])
+        elif itrans:
             ### the append assumes that the maatra always comes after independent vowel in the df
-            ITRANS_TO_OFFSET[itrans].append(o)
+            ### (the halant has no ITRANS representation of its own)
+            itrans_to_offset[itrans].append(o)
+
+    ### prefix trie of the ITRANS codes, for longest match decoding: nested dicts keyed by
+    ### characters, the offsets of a code are stored under the empty string key of its node
+    itrans_trie = {}
+    for itrans, offs in itrans_to_offset.items():
+        node = itrans_trie
+        for c in itrans:
+            node = node.setdefault(c, {})
+        node[""] = offs
+
+    ITRANS_TRIE = itrans_trie
+    ITRANS_TO_OFFSET = itrans_to_offset
+    OFFSET_TO_ITRANS = offset_to_itrans
+
+
+_RESOURCE_LOADERS = {
+    "OFFSET_TO_ITRANS": _load_itrans_maps,
+    "ITRANS_TO_OFFSET": _load_itrans_maps,
+    "ITRANS_TRIE": _load_itrans_maps,
+}
+
+
+def _get_resource(name):
+    return common.load_lazy_resource(globals(), name, _RESOURCE_LOADERS[name])
+
 
-        # DUPLICATE_ITRANS_REPRESENTATIONS moved to module level
+def __getattr__(name):
+    if name in _RESOURCE_LOADERS:
+        return _get_resource(name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def init():
+    """
+    To be called by library loader, do not call it in your program.
+    Eagerly loads the ITRANS maps, which are otherwise loaded on first access.
+    """
+    for name in _RESOURCE_LOADERS:
+        _get_resource(name)
 
 
 class UnicodeIndicTransliterator(object):
@@ -118,6 +159,42 @@ class UnicodeIndicTransliterator(object):
 
         return offset
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def get_translation_table(lang1_code, lang2_code):
+        """
+        Returns the `str.translate` table converting the script of lang1 to the script of lang2.
+        Tables are computed on first use and cached, they must not be modified.
+
+        lang1_code: language 1 code
+        lang2_code: language 2 code
+        """
+        base1 = langinfo.SCRIPT_DESCRIPTORS[lang1_code].base
+        base2 = langinfo.SCRIPT_DESCRIPTORS[lang2_code].base
+
+        table = {}
+        for offset in range(
+            langinfo.COORDINATED_RANGE_START_INCLUSIVE,
+            langinfo.COORDINATED_RANGE_END_INCLUSIVE + 1,
+        ):
+            c = chr(base1 + offset)
+            # the dandas are shared by all the scripts, they are left as is
+            if c == "\u0964" or c == "\u0965":
+                continue
+
+            if lang2_code == "ta":
+                # tamil exceptions
+                newc = chr(
+                    base2 + UnicodeIndicTransliterator._correct_tamil_mapping(offset)
+                )
+            else:
+                newc = chr(base2 + offset)
+
+            if newc != c:
+                table[ord(c)] = newc
+
+        return table
+
     @staticmethod
     def transliterate(text, lang1_code, lang2_code):
         """
@@ -127,33 +204,162 @@ class UnicodeIndicTransliterator(object):
         lang1_code: language 1 code
         lang1_code: language 2 code
         """
+        cache = transliteration_cache.get_cache()
+        if cache is not None:
+            return cache.transliterate_words(
+                text,
+                lang1_code,
+                lang2_code,
+                "unicode",
+                UnicodeIndicTransliterator._transliterate,
+            )
+        return UnicodeIndicTransliterator._transliterate(text, lang1_code, lang2_code)
+
+    @staticmethod
+    def _transliterate(text, lang1_code, lang2_code):
         if (
-            lang1_code in langinfo.SCRIPT_RANGES
-            and lang2_code in langinfo.SCRIPT_RANGES
+            lang1_code in langinfo.SUPPORTED_LANGUAGES
+            and lang2_code in langinfo.SUPPORTED_LANGUAGES
         ):
-            trans_lit_text = []
-            for c in text:
-                newc = c
-                offset = ord(c) - langinfo.SCRIPT_RANGES[lang1_code][0]
-                if (
-                    offset >= langinfo.COORDINATED_RANGE_START_INCLUSIVE
-                    and offset <= langinfo.COORDINATED_RANGE_END_INCLUSIVE
-                    and c != "\u0964"
-                    and c != "\u0965"
-                ):
-                    if lang2_code == "ta":
-                        # tamil exceptions
-                        offset = UnicodeIndicTransliterator._correct_tamil_mapping(
-                            offset
-                        )
-                    newc = chr(langinfo.SCRIPT_RANGES[lang2_code][0] + offset)
-
-                trans_lit_text.append(newc)
-
-            return "".join(trans_lit_text)
+            return text.translate(
+                UnicodeIndicTransliterator.get_translation_table(lang1_code, lang2_code)
+            )
         else:
             return text
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def get_codepoint_table(lang1_code, lang2_code):
+        """
+        Returns the codepoint of the first character of the script of lang1 and a
+        read-only uint32 array with the lang2 codepoint of each of the 128 characters of
+        the script of lang1 (characters which are not transliterated map to themselves).
+        This is the `get_translation_table` mapping, for numpy codepoint arrays.
+
+        lang1_code: language 1 code
+        lang2_code: language 2 code
+        """
+        base1 = langinfo.SCRIPT_DESCRIPTORS[lang1_code].base
+        translation_table = UnicodeIndicTransliterator.get_translation_table(
+            lang1_code, lang2_code
+        )
+
+        codepoints = np.arange(base1, base1 + 0x80, dtype=np.uint32)
+        for i, c in enumerate(codepoints.tolist()):
+            if c in translation_table:
+                codepoints[i] = ord(translation_table[c])
+        codepoints.setflags(write=False)
+        return base1, codepoints
+
+    @staticmethod
+    def transliterate_codepoints(codepoints, lang1_code, lang2_code, out=None):
+        """
+        convert the source language script (lang1) to target language script (lang2),
+        for a numpy uint32 array of Unicode codepoints (of any shape), e.g. text
+        decoded with `np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)`.
+        Gives the same result as `transliterate` on the corresponding text.
+
+        codepoints: uint32 array
+        lang1_code: language 1 code
+        lang2_code: language 2 code
+        out: array for the result, which can be codepoints itself. A new array is
+            allocated if None
+        """
+        if codepoints.dtype != np.uint32:
+            raise ValueError(
+                "Expected an array of uint32 codepoints, got {}".format(codepoints.dtype)
+            )
+        if out is None:
+            out = np.empty_like(codepoints)
+        np.copyto(out, codepoints)
+
+        if (
+            lang1_code in langinfo.SUPPORTED_LANGUAGES
+            and lang2_code in langinfo.SUPPORTED_LANGUAGES
+        ):
+            base1, table = UnicodeIndicTransliterator.get_codepoint_table(
+                lang1_code, lang2_code
+            )
+            # unsigned arithmetic: codepoints below the script wrap to large offsets
+            offsets = codepoints - np.uint32(base1)
+            in_script = offsets < 0x80
+            np.copyto(out, table[offsets & np.uint32(0x7F)], where=in_script)
+
+        return out
+
+    @staticmethod
+    def transliterate_array(texts, lang1_code, lang2_code):
+        """
+        convert the source language script (lang1) to target language script (lang2),
+        for a numpy array of strings (dtype '<U'), without creating Python strings.
+        Returns a new array of the same shape and dtype.
+
+        texts: numpy array of strings
+        lang1_code: language 1 code
+        lang2_code: language 2 code
+        """
+        texts = np.asarray(texts)
+        if texts.dtype.kind != "U":
+            raise ValueError("Expected an array of strings, got {}".format(texts.dtype))
+        texts = np.ascontiguousarray(texts, dtype=texts.dtype.newbyteorder("="))
+
+        codepoints = texts.view(np.uint32)
+        return UnicodeIndicTransliterator.transliterate_codepoints(
+            codepoints, lang1_code, lang2_code
+        ).view(texts.dtype)
+
+    @staticmethod
+    def transliterate_iter(
+        texts,
+        lang1_code,
+        lang2_code,
+        n_jobs=1,
+        chunk_size=parallel.DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Lazily transliterates an iterable of texts (see `transliterate`), yielding the
+        results in order
+
+        texts: iterable of texts to transliterate
+        lang1_code: language 1 code
+        lang2_code: language 2 code
+        n_jobs: number of worker processes, see `indicnlp.parallel.get_num_jobs`
+        chunk_size: number of texts sent to a worker at a time
+        """
+        return parallel.imap_chunked(
+            _transliterate_chunk,
+            texts,
+            args=(lang1_code, lang2_code),
+            n_jobs=n_jobs,
+            chunk_size=chunk_size,
+        )
+
+    @staticmethod
+    def transliterate_batch(
+        texts,
+        lang1_code,
+        lang2_code,
+        n_jobs=1,
+        chunk_size=parallel.DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Transliterates a list of texts (see `transliterate`), returns the list of results.
+        See `transliterate_iter` for the arguments.
+        """
+        return list(
+            UnicodeIndicTransliterator.transliterate_iter(
+                texts, lang1_code, lang2_code, n_jobs=n_jobs, chunk_size=chunk_size
+            )
+        )
+
+
+def _transliterate_chunk(texts, lang1_code, lang2_code):
+    # runs in the worker processes, the translation table is cached across chunks
+    return [
+        UnicodeIndicTransliterator.transliterate(text, lang1_code, lang2_code)
+        for text in texts
+    ]
+
 
 class ItransTransliterator(object):
     """
@@ -162,132 +368,204 @@ class ItransTransliterator(object):
 
     @staticmethod
     def to_itrans(text, lang_code):
-        if lang_code in langinfo.SCRIPT_RANGES:
-            if lang_code == "ml":
-                # Change from chillus characters to corresponding consonant+halant
-                text = text.replace("\u0d7a", "\u0d23\u0d4d")
-                text = text.replace("\u0d7b", "\u0d28\u0d4d")
-                text = text.replace("\u0d7c", "\u0d30\u0d4d")
-                text = text.replace("\u0d7d", "\u0d32\u0d4d")
-                text = text.replace("\u0d7e", "\u0d33\u0d4d")
-                text = text.replace("\u0d7f", "\u0d15\u0d4d")
-
-            offsets = [isc.get_offset(c, lang_code) for c in text]
-
-            ### naive lookup
-            # itrans_l = [ OFFSET_TO_ITRANS.get(o, '-' ) for o in offsets ]
-            itrans_l = []
-            for o in offsets:
-                itrans = OFFSET_TO_ITRANS.get(
-                    o, chr(langinfo.SCRIPT_RANGES[lang_code][0] + o)
+        if lang_code in langinfo.SUPPORTED_LANGUAGES:
+            cache = transliteration_cache.get_cache()
+            if cache is not None:
+                itrans = cache.transliterate_words(
+                    text, lang_code, "itrans", "itrans", _itrans_scheme
                 )
-                if langinfo.is_halanta_offset(o):
-                    itrans = ""
-                    if len(itrans_l) > 0:
-                        itrans_l.pop()
-                elif langinfo.is_vowel_sign_offset(o) and len(itrans_l) > 0:
-                    itrans_l.pop()
-                itrans_l.extend(itrans)
-
-            return "".join(itrans_l)
+                if itrans is not None:
+                    return itrans
+            return ItransTransliterator._to_itrans(text, lang_code)
 
         else:
             return text
 
     @staticmethod
-    def from_itrans(text, lang):
+    def _to_itrans(text, lang_code, word_level=False):
         """
-        TODO: Document this method properly
-        TODO: A little hack is used to handle schwa: needs to be documented
-        TODO: check for robustness
+        word_level: if True, returns None if a halant or vowel sign would remove a
+            character output before the text (which can not be done for a single word)
         """
+        to_itrans_table = _to_itrans_table(lang_code)
+
+        ## the output is a list of non-empty strings, a halant or vowel sign removes
+        ## the last character output before it (e.g. the schwa of a consonant)
+        itrans_l = []
+        for c in text:
+            entry = to_itrans_table.get(c)
+            if entry is None:
+                itrans_l.append(c)
+                continue
+
+            pop, itrans = entry
+            if pop and len(itrans_l) > 0:
+                last = itrans_l[-1]
+                if len(last) > 1:
+                    itrans_l[-1] = last[:-1]
+                else:
+                    itrans_l.pop()
+            elif pop and word_level:
+                return None
+            if itrans:
+                itrans_l.append(itrans)
 
-        MAXCODE = 4  ### TODO: Needs to be fixed
+        return "".join(itrans_l)
+
+    @staticmethod
+    def from_itrans(text, lang):
+        """
+        Converts ITRANS text to the script of lang.
 
+        The text is decoded in a single pass: at each position, the longest ITRANS code
+        is matched using a prefix trie, characters which do not start any code are
+        copied as is. Unnecessary halants (before a vowel sign, a nukta or the schwa
+        placeholder) are deleted as the output is produced.
+
+        A little hack is used to handle schwa: the ITRANS map decodes consonants to
+        consonant+halant, and 'a' after a consonant to the placeholder character at
+        offset 0x7F. The placeholder deletes the preceding halant and is removed from
+        the output at the end.
+        """
+        cache = transliteration_cache.get_cache()
+        if cache is not None:
+            return cache.transliterate_words(
+                text, "itrans", lang, "itrans", _itrans_scheme
+            )
+        return ItransTransliterator._from_itrans(text, lang)
+
+    @staticmethod
+    def _from_itrans(text, lang):
         ##  handle_duplicate_itrans_representations
+        ## (the replacements are applied one after the other, since some of them apply to
+        ## the output of others)
         for k, v in DUPLICATE_ITRANS_REPRESENTATIONS.items():
             if k in text:
                 text = text.replace(k, v)
 
-        start = 0
-        match = None
-        solution = []
-
-        i = start + 1
-        while i <= len(text):
-            itrans = text[start:i]
-
-            #         print('===')
-            #         print('i: {}'.format(i))
-            #         if i<len(text):
-            #             print('c: {}'.format(text[i-1]))
-            #         print('start: {}'.format(start))
-            #         print('itrans: {}'.format(itrans))
-
-            if itrans in ITRANS_TO_OFFSET:
-                offs = ITRANS_TO_OFFSET[itrans]
+        itrans_trie = _get_resource("ITRANS_TRIE")
+        base, halant, schwa_placeholder, halant_deleters = _from_itrans_chars(lang)
 
+        solution = []
+        n = len(text)
+        start = 0
+        while start < n:
+            ## longest match
+            node = itrans_trie
+            match_end = start + 1
+            offs = None
+            i = start
+            while i < n:
+                node = node.get(text[i])
+                if node is None:
+                    break
+                i += 1
+                if "" in node:
+                    match_end = i
+                    offs = node[""]
+
+            if offs is None:  ## unknown character
+                chars = text[start]
+            else:
                 ## single element list - no problem
-                ## except when it is 'a'
 
                 ## 2 element list of 2 kinds:
                 ### 1. alternate char for independent/dependent vowel
                 ### 2. consonant + halant
-
                 if len(offs) == 2 and langinfo.is_vowel_offset(offs[0]):
-                    ### 1. alternate char for independent/dependent vowel
                     ## if previous is a consonant, then use the dependent vowel
-                    if len(solution) > 0 and langinfo.is_halanta(solution[-1], lang):
-                        offs = [offs[1]]  ## dependent vowel
+                    if len(solution) > 0 and solution[-1] == halant:
+                        offs = offs[1:]  ## dependent vowel
                     else:
-                        offs = [offs[0]]  ## independent vowel
+                        offs = offs[:1]  ## independent vowel
+                chars = [chr(base + o) for o in offs]
 
-                c = "".join([langinfo.offset_to_char(x, lang) for x in offs])
-                match = (i, c)
+            for c in chars:
+                ## delete unecessary halants
+                if (
+                    c in halant_deleters
+                    and len(solution) > 0
+                    and solution[-1] == halant
+                ):
+                    solution.pop()
+                solution.append(c)
 
-            elif len(itrans) == 1:  ## unknown character
-                match = (i, itrans)
-            elif (
-                i < len(text) and (i - start) < MAXCODE + 1
-            ):  ## continue matching till MAXCODE length substring
-                i = i + 1
-                continue
-            else:
-                solution.extend(match[1])
-                #             start=i-1
-                start = match[0]
-                i = start
-                match = None
-            #             print('match done')
-
-            #         print('match: {}'.format(match))
-
-            i = i + 1
-
-        ### flush matches
-        if match is not None:
-            solution.extend(match[1])
-
-        #### post-processing
-        ## delete unecessary halants
-        #     print(''.join(solution))
-        temp_out = list("".join(solution))
-        rem_indices = []
-        for i in range(len(temp_out) - 1):
-            if langinfo.is_halanta(temp_out[i], lang) and (
-                langinfo.is_vowel_sign(temp_out[i + 1], lang)
-                or langinfo.is_nukta(temp_out[i + 1], lang)
-                or temp_out[i + 1] == langinfo.offset_to_char(0x7F, lang)
-            ):
-                rem_indices.append(i)
-        #         if temp_out[i]==langinfo.offset_to_char(0x7f,lang):
-        #             rem_indices.append(i)
-        for i in reversed(rem_indices):
-            temp_out.pop(i)
-
-        out = "".join(temp_out)
+            start = match_end
 
         ## delete schwa placeholder
-        out = out.replace(langinfo.offset_to_char(0x7F, lang), "")
+        return "".join(solution).replace(schwa_placeholder, "")
 
-        return out
+
+def _itrans_scheme(word, src, tgt):
+    # uncached transliteration for the "itrans" scheme of the transliteration cache
+    if src == "itrans":
+        return ItransTransliterator._from_itrans(word, tgt)
+    else:
+        return ItransTransliterator._to_itrans(word, src, word_level=True)
+
+
+transliteration_cache.register_scheme(
+    "unicode", UnicodeIndicTransliterator._transliterate
+)
+transliteration_cache.register_scheme("itrans", _itrans_scheme)
+
+
+# Malayalam chillu characters, converted like the corresponding consonant+halant
+_MALAYALAM_CHILLUS = {
+    "\u0d7a": "\u0d23\u0d4d",
+    "\u0d7b": "\u0d28\u0d4d",
+    "\u0d7c": "\u0d30\u0d4d",
+    "\u0d7d": "\u0d32\u0d4d",
+    "\u0d7e": "\u0d33\u0d4d",
+    "\u0d7f": "\u0d15\u0d4d",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _to_itrans_table(lang):
+    """
+    Returns the table used by `ItransTransliterator.to_itrans` for the script of lang: it
+    maps each of the 128 characters of the script to a (pop, itrans) pair, where pop
+    is True if the character removes the last character output before it. The other
+    characters are copied as is.
+    """
+    offset_to_itrans = _get_resource("OFFSET_TO_ITRANS")
+    base = langinfo.SCRIPT_DESCRIPTORS[lang].base
+
+    table = {}
+    for o in range(0x80):
+        itrans = offset_to_itrans.get(o, chr(base + o))
+        if langinfo.is_halanta_offset(o):
+            table[chr(base + o)] = (True, "")
+        elif langinfo.is_vowel_sign_offset(o):
+            table[chr(base + o)] = (True, itrans)
+        else:
+            table[chr(base + o)] = (False, itrans)
+
+    if lang == "ml":
+        for chillu, (consonant, halant) in _MALAYALAM_CHILLUS.items():
+            itrans = table[consonant][1]
+            ## the halant removes the schwa of the consonant
+            if itrans:
+                table[chillu] = (False, itrans[:-1])
+            else:
+                table[chillu] = (True, "")
+
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def _from_itrans_chars(lang):
+    """
+    Returns the characters of the script of lang used by `ItransTransliterator.from_itrans`:
+    the script base codepoint, the halant, the schwa placeholder and the set of characters
+    deleting a preceding halant
+    """
+    base = langinfo.SCRIPT_DESCRIPTORS[lang].base
+    halant = chr(base + langinfo.HALANTA_OFFSET)
+    schwa_placeholder = chr(base + 0x7F)
+    halant_deleters = frozenset(
+        [chr(base + o) for o in range(0x3E, 0x4D)]
+        + [chr(base + langinfo.NUKTA_OFFSET), schwa_placeholder]
+    )
+    return base, halant, schwa_placeholder, halant_deleters
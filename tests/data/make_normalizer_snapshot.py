@@ -0,0 +1,184 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+"""
+Generates normalizer_snapshot.json.gz, the outputs of the hand-written normalizers
+which preceded the rule compiler (indicnlp/normalize/indic_normalize.py at commit
+0b71852), for every language and option combination. Run from the root of the
+repository:
+
+    PYTHONPATH=. python tests/data/make_normalizer_snapshot.py
+
+The snapshot is frozen: it must not be regenerated with the current normalizers.
+"""
+
+import gzip
+import itertools
+import json
+import os
+import random
+import subprocess
+import sys
+import types
+
+from indicnlp import langinfo
+
+REFERENCE_COMMIT = "0b71852"
+
+SNAPSHOT_FNAME = os.path.join(os.path.dirname(__file__), "normalizer_snapshot.json.gz")
+
+LANGUAGES = [
+    "hi",
+    "mr",
+    "sa",
+    "kK",
+    "ne",
+    "sd",
+    "pa",
+    "gu",
+    "bn",
+    "as",
+    "or",
+    "ml",
+    "kn",
+    "ta",
+    "te",
+    "si",
+]
+
+NASALS_MODES = [
+    "do_nothing",
+    "to_anusvaara_strict",
+    "to_anusvaara_relaxed",
+    "to_nasal_consonants",
+]
+
+# options of the script specific normalizers
+SCRIPT_OPTIONS = {
+    "pa": ["do_canonicalize_addak", "do_canonicalize_tippi", "do_replace_vowel_bases"],
+    "or": ["do_remap_wa"],
+    "bn": ["do_remap_assamese_chars"],
+    "as": ["do_remap_assamese_chars"],
+    "ml": ["do_canonicalize_chillus", "do_correct_geminated_T"],
+}
+
+NUM_TEXTS = 40
+
+# characters and strings rewritten by the normalizers, in addition to the characters
+# of the scripts
+SPECIAL = list("﻿￾⁠­​ ‌‍„“”–—´‘‚’…|:'\\ .,u09fa") + [
+    "''",
+    "´´",
+    "\\u093C",
+    "\\u0A3C",
+    "\\u0ABC",
+    "\\u0B3C",
+    "\\u09BC",
+    "\\u0a71",
+    ": ",
+]
+
+
+def get_configs(lang):
+    """
+    Keyword arguments of all the normalizers of a language
+    """
+    options = SCRIPT_OPTIONS.get(lang, [])
+    configs = []
+    for remove_nuktas, nasals_mode, chandras, vowel_ending in itertools.product(
+        [False, True], NASALS_MODES, [False, True], [False, True]
+    ):
+        for values in itertools.product([False, True], repeat=len(options)):
+            config = dict(
+                remove_nuktas=remove_nuktas,
+                nasals_mode=nasals_mode,
+                do_normalize_chandras=chandras,
+                do_normalize_vowel_ending=vowel_ending,
+            )
+            config.update(zip(options, values))
+            configs.append(config)
+    return configs
+
+
+def config_key(lang, config):
+    return json.dumps([lang, config], sort_keys=True)
+
+
+def _random_texts(rng, lang):
+    base = langinfo.SCRIPT_DESCRIPTORS[lang].base
+    offset = lambda o: chr(base + o)
+
+    # nasal clusters, anusvaara + consonant, words ending with a consonant
+    clusters = [
+        offset(n) + offset(0x4D) + offset(c)
+        for n in [0x19, 0x1E, 0x23, 0x28, 0x29, 0x2E]
+        for c in range(0x15, 0x2E)
+    ]
+    clusters += [offset(0x02) + offset(c) for c in range(0x15, 0x2E)]
+    clusters += [offset(c) + " " for c in range(0x15, 0x3A)]
+
+    texts = []
+    for _ in range(NUM_TEXTS):
+        pieces = []
+        for _ in range(rng.randint(0, 30)):
+            r = rng.random()
+            if r < 0.5:
+                pieces.append(offset(rng.randrange(0x80)))
+            elif r < 0.65:
+                pieces.append(rng.choice(clusters))
+            elif r < 0.8:
+                pieces.append(" ")
+            else:
+                pieces.append(rng.choice(SPECIAL))
+        texts.append("".join(pieces))
+    return texts
+
+
+def _load_reference_module():
+    source = subprocess.run(
+        [
+            "git",
+            "show",
+            "{}:indicnlp/normalize/indic_normalize.py".format(REFERENCE_COMMIT),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    module = types.ModuleType("reference_indic_normalize")
+    exec(compile(source, "reference_indic_normalize.py", "exec"), module.__dict__)
+    return module
+
+
+def main():
+    reference = _load_reference_module()
+    factory = reference.IndicNormalizerFactory()
+    rng = random.Random(0)
+
+    texts = {}
+    outputs = {}
+    for lang in LANGUAGES:
+        texts[lang] = _random_texts(rng, lang)
+        for config in get_configs(lang):
+            normalizer = factory.get_normalizer(lang, **config)
+            outputs[config_key(lang, config)] = [
+                normalizer.normalize(text) for text in texts[lang]
+            ]
+
+    with gzip.open(SNAPSHOT_FNAME, "wt", encoding="utf-8") as outfile:
+        json.dump(
+            {"commit": REFERENCE_COMMIT, "texts": texts, "outputs": outputs},
+            outfile,
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+    print("{} configurations".format(len(outputs)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
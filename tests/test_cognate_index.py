@@ -0,0 +1,77 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+import random
+
+import pytest
+
+from indicnlp.script import indic_scripts as isc
+from indicnlp.script.cognate_index import CognateIndex
+from indicnlp.transliterate.unicode_transliterate import UnicodeIndicTransliterator
+
+_CONSONANTS = [chr(c) for c in range(0x915, 0x939)]
+_VOWEL_SIGNS = ["", "ा", "ि", "ी", "ु", "े", "ो", "्"]
+
+
+def _random_word(rng):
+    return "".join(
+        rng.choice(_CONSONANTS) + rng.choice(_VOWEL_SIGNS)
+        for _ in range(rng.randint(1, 5))
+    )
+
+
+def _perturb(word, rng):
+    chars = list(word)
+    i = rng.randrange(len(chars))
+    if rng.random() < 0.5:
+        chars[i] = rng.choice(_CONSONANTS)
+    else:
+        del chars[i]
+    return "".join(chars) or word
+
+
+@pytest.fixture(scope="module")
+def vocab():
+    rng = random.Random(0)
+    return sorted({_random_word(rng) for _ in range(500)})
+
+
+@pytest.fixture(scope="module")
+def index(vocab):
+    return CognateIndex(vocab, "hi")
+
+
+@pytest.mark.parametrize("lang", ["hi", "bn", "ta"])
+def test_top1_matches_brute_force(vocab, index, lang):
+    rng = random.Random(1)
+    for _ in range(50):
+        query = UnicodeIndicTransliterator.transliterate(
+            _perturb(rng.choice(vocab), rng), "hi", lang
+        )
+        best = max(isc.lcsr_indic(query, word, lang, "hi")[0] for word in vocab)
+
+        (word, score), *_ = index.query(query, lang, k=1)
+        assert score == pytest.approx(best)
+        assert isc.lcsr_indic(query, word, lang, "hi")[0] == pytest.approx(score)
+
+
+def test_query_results_are_sorted_and_exact(vocab, index):
+    query = UnicodeIndicTransliterator.transliterate(vocab[0], "hi", "bn")
+    results = index.query(query, "bn", k=5)
+
+    assert len(results) == 5
+    assert results[0] == (vocab[0], 1.0)
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+    for word, score in results:
+        assert isc.lcsr_indic(query, word, "bn", "hi")[0] == pytest.approx(score)
+
+
+def test_empty_query(index):
+    assert index.query("", "hi") == []
+    assert index.query_batch(["", ""], "hi") == [[], []]
@@ -0,0 +1,60 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+"""
+Compares the normalizers compiled from rules with a frozen snapshot of the outputs
+of the hand-written normalizers they replaced, for every language, nasals_mode and
+option combination. The snapshot is generated by data/make_normalizer_snapshot.py.
+"""
+
+import gzip
+import json
+import os
+
+import pytest
+
+from indicnlp.normalize.indic_normalize import IndicNormalizerFactory
+
+SNAPSHOT_FNAME = os.path.join(
+    os.path.dirname(__file__), "data", "normalizer_snapshot.json.gz"
+)
+
+# number of boolean options of the script specific normalizers
+_NUM_SCRIPT_OPTIONS = {"pa": 3, "or": 1, "bn": 1, "as": 1, "ml": 2}
+
+
+def _load_snapshot():
+    with gzip.open(SNAPSHOT_FNAME, "rt", encoding="utf-8") as infile:
+        snapshot = json.load(infile)
+
+    configs = {}
+    for key, outputs in snapshot["outputs"].items():
+        lang, config = json.loads(key)
+        configs.setdefault(lang, []).append((config, outputs))
+    return snapshot["texts"], configs
+
+
+_TEXTS, _CONFIGS = _load_snapshot()
+
+
+@pytest.mark.parametrize("lang", sorted(_CONFIGS))
+def test_matches_snapshot(lang):
+    # remove_nuktas x nasals_mode x do_normalize_chandras x do_normalize_vowel_ending
+    num_configs = 2 * 4 * 2 * 2 * 2 ** _NUM_SCRIPT_OPTIONS.get(lang, 0)
+    assert len(_CONFIGS[lang]) == num_configs
+
+    factory = IndicNormalizerFactory()
+    for config, expected in _CONFIGS[lang]:
+        normalizer = factory.get_normalizer(lang, **config)
+        outputs = [normalizer.normalize(text) for text in _TEXTS[lang]]
+        assert outputs == expected, config
+
+
+def test_snapshot_covers_all_languages():
+    assert len(_CONFIGS) == 16
+    assert all(len(texts) == 40 for texts in _TEXTS.values())
@@ -0,0 +1,178 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+import random
+
+import pytest
+import regex
+
+from indicnlp.normalize import rule_compiler
+from indicnlp.normalize.rule_compiler import CALL, MAP, REPLACE, SUB, RulePlan
+
+
+def _apply_in_order(rules, text):
+    """
+    Reference semantics of a list of rules: each rule applied to the whole text, in order
+    """
+    for rule in rules:
+        if rule[0] == MAP:
+            text = text.translate(
+                {(ord(c) if isinstance(c, str) else c): v for c, v in rule[1].items()}
+            )
+        elif rule[0] == REPLACE:
+            text = text.replace(rule[1], rule[2])
+        elif rule[0] == SUB:
+            text = rule[1].sub(rule[2], text)
+        else:
+            text = rule[1](text)
+    return text
+
+
+def _random_rules(rng, alphabet, num_rules, map_size, replace_len):
+    """
+    Random rules over a small alphabet, so that they interact. The alphabet contains
+    ':', '\\' and '1', which appear in the templates of the SUB rules.
+    """
+
+    def random_string(min_len, max_len):
+        return "".join(
+            rng.choice(alphabet) for _ in range(rng.randint(min_len, max_len))
+        )
+
+    letters = [c for c in alphabet if c.isalpha()]
+    rules = []
+    for _ in range(rng.randint(1, num_rules)):
+        r = rng.random()
+        if r < 0.35:
+            table = {
+                rng.choice(alphabet): random_string(0, 2)
+                for _ in range(rng.randint(1, map_size))
+            }
+            rules.append((MAP, table))
+        elif r < 0.7:
+            rules.append((REPLACE, random_string(*replace_len), random_string(0, 2)))
+        elif r < 0.9:
+            first = rng.choice(letters[:5])
+            second = rng.choice(letters[:5] + [":"])
+            pattern = regex.compile("({}){}".format(first, regex.escape(second)))
+            template = "\\\\1" + rng.choice(letters[-2:])
+            # the exact alphabet of the pattern, a superset of it, or unknown
+            r = rng.random()
+            if r < 0.4:
+                rule_alphabet = {first, second}
+            elif r < 0.7:
+                rule_alphabet = frozenset(alphabet) - set(letters[-2:])
+            else:
+                rule_alphabet = None
+            rules.append((SUB, pattern, template, rule_alphabet))
+        else:
+            rules.append((CALL, str.upper))
+
+    # the text is mostly made of the strings read and written by the rules, which
+    # makes their interactions likely
+    pieces = [rule[1] for rule in rules if rule[0] == REPLACE]
+    pieces += [rule[2] for rule in rules if rule[0] == REPLACE]
+    for rule in rules:
+        if rule[0] == MAP:
+            pieces.extend(rule[1])
+            pieces.extend(rule[1].values())
+    pieces = [piece for piece in pieces if piece] or [""]
+    text = "".join(
+        rng.choice(pieces) if rng.random() < 0.6 else random_string(1, 2)
+        for _ in range(rng.randint(0, 8))
+    )
+    return rules, text
+
+
+# alphabet, maximum number of rules, maximum map size, length range of the patterns
+# of the replacements
+_CASES = {
+    "few_chars": ("abcdeXY:\\1", 6, 3, (1, 2)),
+    "non_ascii": ("abcXYéñ:\\1", 6, 3, (1, 2)),
+    "large_maps": ("abcdefghijklmnopXY:\\1", 6, 14, (1, 2)),
+    "long_lists": ("abcdeXY:\\1", 14, 3, (2, 3)),
+    "translate": (
+        "abcde" + "".join(chr(c) for c in range(0x900, 0x960)) + "XY:\\1",
+        4,
+        80,
+        (1, 2),
+    ),
+}
+
+
+@pytest.mark.parametrize("alternation_min_size", [None, 2])
+@pytest.mark.parametrize("case", sorted(_CASES))
+def test_compiled_rules_match_rules_applied_in_order(
+    monkeypatch, case, alternation_min_size
+):
+    # a low threshold exercises the merging of replacements into alternations
+    if alternation_min_size is not None:
+        monkeypatch.setattr(
+            rule_compiler, "_ALTERNATION_MIN_SIZE", alternation_min_size
+        )
+
+    alphabet, num_rules, map_size, replace_len = _CASES[case]
+    rng = random.Random(case)
+    for _ in range(3000):
+        rules, text = _random_rules(rng, alphabet, num_rules, map_size, replace_len)
+        expected = _apply_in_order(rules, text)
+
+        compiled = rule_compiler.compile_rules(rules)
+        assert _apply_in_order(compiled, text) == expected, (rules, text, compiled)
+        assert RulePlan(rules).apply(text) == expected, (rules, text)
+
+
+def test_single_character_replacements_are_merged():
+    rules = [(REPLACE, "a", "b"), (REPLACE, "b", "c"), (REPLACE, "x", "")]
+    assert rule_compiler.compile_rules(rules) == [(MAP, {"a": "c", "b": "c", "x": ""})]
+
+
+def test_independent_replacements_are_merged_into_an_alternation():
+    rules = [(REPLACE, "{}{}".format(c, c), c.upper()) for c in "abcdefgh"]
+    plan = RulePlan(rules)
+
+    assert len(plan) == 1
+    assert plan.apply("aabbxhh") == "ABxH"
+
+
+def test_replacements_feeding_later_ones_are_not_merged(monkeypatch):
+    monkeypatch.setattr(rule_compiler, "_ALTERNATION_MIN_SIZE", 2)
+
+    # the output of the first replacement is read by the second
+    rules = [(REPLACE, "ab", "c"), (REPLACE, "cd", "e")]
+    assert RulePlan(rules).apply("abd") == "e"
+
+    # deleting the pattern of the first replacement joins its neighbours
+    rules = [(REPLACE, "ab", ""), (REPLACE, "cd", "e")]
+    assert RulePlan(rules).apply("cabd") == "e"
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [({"1": "2"}, {"é": "\\"}), ({"X": "Z"}, {"1": "2"})],
+)
+def test_maps_are_not_moved_into_template_escapes(first, second):
+    # the first map can not move past the template, which writes its key. The second
+    # one would be merged into it through the template, changing its escapes
+    pattern = regex.compile("(a)b")
+    rules = [(MAP, first), (SUB, pattern, "\\1Xé", {"a", "b"}), (MAP, second)]
+    assert RulePlan(rules).apply("abé1") == _apply_in_order(rules, "abé1")
+
+
+def test_deleting_maps_do_not_move_past_patterns():
+    pattern = regex.compile("(a)b")
+    rules = [(MAP, {"1": "2"}), (SUB, pattern, "\\1X", {"a", "b"}), (MAP, {"é": ""})]
+    assert RulePlan(rules).apply("aéb") == _apply_in_order(rules, "aéb")
+
+
+def test_opaque_rules_are_kept_in_place():
+    rules = [(REPLACE, "a", "b"), (CALL, str.upper), (REPLACE, "B", "c")]
+    plan = RulePlan(rules)
+
+    assert len(plan) == 3
+    assert plan.apply("ab") == "cc"
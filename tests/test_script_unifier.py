@@ -0,0 +1,90 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+import random
+
+import pytest
+
+from indicnlp import langinfo
+from indicnlp.transliterate.script_unifier import (
+    AggressiveScriptUnifier,
+    BasicScriptUnifier,
+    CompiledScriptUnifier,
+    NaiveScriptUnifier,
+)
+
+NASALS_MODES = [
+    "do_nothing",
+    "to_anusvaara_strict",
+    "to_anusvaara_relaxed",
+    "to_nasal_consonants",
+]
+COMMON_LANGS = ["hi", "ta"]
+
+# characters rewritten by the normalizers, in addition to those of the scripts
+_SPECIAL = list("﻿￾⁠­​ ‌‍„“”–—´‘‚’…|:'\\ \n.,u09fa") + [
+    "''",
+    "\\u093C",
+    "\\u0a71",
+    ": ",
+    "  ",
+]
+
+
+def _random_text(rng, lang):
+    base = langinfo.SCRIPT_DESCRIPTORS[lang].base
+    chars = []
+    for _ in range(rng.randint(0, 60)):
+        r = rng.random()
+        if r < 0.6:
+            chars.append(chr(base + rng.randrange(0x80)))
+        elif r < 0.7:
+            chars.append(chr(0x900 + rng.randrange(0x500)))
+        elif r < 0.85:
+            chars.append(" ")
+        else:
+            chars.append(rng.choice(_SPECIAL))
+    return "".join(chars)
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    rng = random.Random(0)
+    return {
+        lang: [_random_text(rng, lang) for _ in range(50)]
+        for lang in sorted(langinfo.SUPPORTED_LANGUAGES)
+    }
+
+
+def _check_unifier(unifier, langs, corpus):
+    compiled = CompiledScriptUnifier(unifier)
+    for lang in langs:
+        for text in corpus[lang]:
+            assert compiled.transform(text, lang) == unifier.transform(text, lang), (
+                lang,
+                text,
+            )
+
+
+@pytest.mark.parametrize("common_lang", COMMON_LANGS)
+@pytest.mark.parametrize("nasals_mode", NASALS_MODES)
+def test_aggressive_unifier(corpus, common_lang, nasals_mode):
+    unifier = AggressiveScriptUnifier(common_lang, nasals_mode)
+    _check_unifier(unifier, sorted(unifier.normalizer_map), corpus)
+
+
+@pytest.mark.parametrize("common_lang", COMMON_LANGS)
+@pytest.mark.parametrize("nasals_mode", NASALS_MODES)
+def test_basic_unifier(corpus, common_lang, nasals_mode):
+    # the languages without a normalizer are only transliterated
+    _check_unifier(BasicScriptUnifier(common_lang, nasals_mode), sorted(corpus), corpus)
+
+
+@pytest.mark.parametrize("common_lang", COMMON_LANGS)
+def test_naive_unifier(corpus, common_lang):
+    _check_unifier(NaiveScriptUnifier(common_lang), sorted(corpus), corpus)
@@ -0,0 +1,93 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+import json
+import os
+import subprocess
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from indicnlp import loader
+from indicnlp.common import IndicNlpException
+from indicnlp.script import shared_phonetic_tables as spt
+
+# Attaches to the block named by argv[1] and prints the tables, as a worker started by
+# a launcher (not a multiprocessing child of the publisher) would
+_WORKER = """
+import json, sys
+from indicnlp import loader
+from indicnlp.script import shared_phonetic_tables as spt
+
+loader.load(shared_phonetic_tables=sys.argv[1])
+tables = spt._get_phonetic_tables()
+print(json.dumps({
+    "tables": [table.tolist() for table in tables],
+    "shared": len(spt._ATTACHED_BLOCKS) == 1,
+}))
+"""
+
+
+def _run_worker(name):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+        + [p for p in [env.get("PYTHONPATH")] if p]
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", _WORKER, name],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    assert "leaked" not in result.stderr
+    return json.loads(result.stdout)
+
+
+def _read_block(shm):
+    header = np.ndarray((spt._HEADER_LENGTH,), dtype=np.int64, buffer=shm.buf)
+    tables = []
+    start = spt._HEADER_LENGTH
+    for i in range(len(spt._TABLE_SETTERS)):
+        rows, cols = header[3 + 2 * i : 5 + 2 * i]
+        tables.append(
+            np.ndarray((rows, cols), dtype=np.int64, buffer=shm.buf, offset=8 * start)
+        )
+        start += rows * cols
+    return tables
+
+
+def test_independent_workers_do_not_remove_the_block():
+    loader.load()
+    expected = [table.tolist() for table in spt._get_phonetic_tables()]
+
+    shm = spt.publish_phonetic_tables()
+    try:
+        for _ in range(2):
+            worker = _run_worker(shm.name)
+            assert worker["shared"]
+            assert worker["tables"] == expected
+
+        # the block and its contents survive the workers
+        assert [table.tolist() for table in _read_block(shm)] == expected
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_attach_rejects_other_blocks():
+    shm = shared_memory.SharedMemory(create=True, size=8 * spt._HEADER_LENGTH)
+    try:
+        with pytest.raises(IndicNlpException):
+            spt.attach_phonetic_tables(shm.name)
+    finally:
+        shm.close()
+        shm.unlink()
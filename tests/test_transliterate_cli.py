@@ -0,0 +1,35 @@
+#
+#  Copyright (c) 2013-present, Anoop Kunchukuttan
+#  All rights reserved.
+#
+#  This source code is licensed under the MIT license found in the
+#  LICENSE file in the root directory of this source tree.
+#
+
+import pytest
+
+from indicnlp.transliterate import cli
+
+
+@pytest.mark.parametrize(
+    "source, target",
+    [("itrans", "xx"), ("hi", "zz"), ("zz", "hi"), ("itrans", "itrans")],
+)
+def test_invalid_languages_are_usage_errors(tmp_path, capsys, source, target):
+    outfname = tmp_path / "out.txt"
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(["-s", source, "-t", target, "-o", str(outfname)])
+
+    assert excinfo.value.code == 2
+    assert "error:" in capsys.readouterr().err
+    assert not outfname.exists()
+
+
+def test_transliterate_file(tmp_path):
+    infname = tmp_path / "in.txt"
+    outfname = tmp_path / "out.txt"
+    infname.write_text("भारत\nदेश\n", encoding="utf-8")
+
+    cli.main(["-s", "hi", "-t", "itrans", str(infname), "-o", str(outfname)])
+
+    assert outfname.read_text(encoding="utf-8") == "bhaarata\ndesha\n"